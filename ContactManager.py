@@ -1,6 +1,11 @@
 import csv
+import heapq
 import os
-from typing import Dict, Optional
+from array import array
+from bisect import bisect_left, insort
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 class Contact:
     def __init__(self, name: str, phone: str, email: str = ""):
@@ -8,30 +13,325 @@ class Contact:
         self.phone = phone.strip()
         self.email = email.strip()
 
+class ContactIndex:
+    """Type-ahead, typo-tolerant and sound-alike lookups over contact names.
+
+    Prefix search bisects a sorted name list, fuzzy search narrows candidates
+    with a trigram index before computing edit distance, and phonetic search
+    groups name words by their Soundex code. Names get integer ids so the
+    posting lists can be compact arrays; deleted ids are left as holes.
+    """
+    SOUNDEX_CODES = {
+        **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'),
+        **dict.fromkeys('dt', '3'), 'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+    }
+
+    def __init__(self, contacts: Dict[str, Dict[str, str]]):
+        self.contacts = contacts
+        self.names: List[Optional[str]] = []
+        self.ids: Dict[str, int] = {}
+        self.sorted_names: List[str] = []
+        self.trigrams: Dict[str, array] = {}
+        self.sounds: Dict[str, array] = {}
+        for name in contacts:
+            self._register(name)
+        self.sorted_names.sort()
+
+    @staticmethod
+    def _trigrams(name: str) -> set:
+        padded = f"  {name} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @classmethod
+    @lru_cache(maxsize=65536)
+    def soundex(cls, word: str) -> str:
+        letters = [c for c in word.lower() if c.isalpha()]
+        if not letters:
+            return ""
+        code, last = letters[0].upper(), cls.SOUNDEX_CODES.get(letters[0], '')
+        for c in letters[1:]:
+            digit = cls.SOUNDEX_CODES.get(c, '')
+            if digit and digit != last:
+                code += digit
+            if c not in 'hw':
+                last = digit
+        return (code + "000")[:4]
+
+    def _register(self, name: str) -> int:
+        name_id = len(self.names)
+        self.names.append(name)
+        self.ids[name] = name_id
+        self.sorted_names.append(name)
+        for gram in self._trigrams(name):
+            self.trigrams.setdefault(gram, array('I')).append(name_id)
+        for code in {self.soundex(word) for word in name.split()} - {""}:
+            self.sounds.setdefault(code, array('I')).append(name_id)
+        return name_id
+
+    def add(self, name: str):
+        if name in self.ids:
+            return
+        self._register(name)
+        # _register appended it; move it into sorted position
+        self.sorted_names.pop()
+        insort(self.sorted_names, name)
+
+    def add_all(self, names: Iterable[str]):
+        """Add many names, merging them into the sorted list in one pass."""
+        added = [name for name in names if name not in self.ids]
+        for name in added:
+            self._register(name)
+        del self.sorted_names[len(self.sorted_names) - len(added):]
+        self.sorted_names = list(heapq.merge(self.sorted_names, sorted(added)))
+
+    def remove(self, name: str):
+        name_id = self.ids.pop(name, None)
+        if name_id is None:
+            return
+        self.names[name_id] = None
+        pos = bisect_left(self.sorted_names, name)
+        if pos < len(self.sorted_names) and self.sorted_names[pos] == name:
+            del self.sorted_names[pos]
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[str]:
+        matches = []
+        for i in range(bisect_left(self.sorted_names, prefix), len(self.sorted_names)):
+            name = self.sorted_names[i]
+            if not name.startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(name)
+        return matches
+
+    @staticmethod
+    def distance(a: str, b: str, limit: int) -> int:
+        """Levenshtein distance, or limit + 1 once it is certain to exceed limit."""
+        if abs(len(a) - len(b)) > limit:
+            return limit + 1
+        previous = list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            current = [i]
+            for j, cb in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (ca != cb)))
+            if min(current) > limit:
+                return limit + 1
+            previous = current
+        return previous[-1]
+
+    def fuzzy(self, query: str, max_distance: int = 2, limit: int = 10) -> List[str]:
+        grams = self._trigrams(query)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for name_id in self.trigrams.get(gram, ()):
+                shared[name_id] = shared.get(name_id, 0) + 1
+
+        # Each edit destroys at most three trigrams, so anything sharing fewer
+        # than this cannot be within max_distance
+        needed = len(grams) - 3 * max_distance
+        matches = []
+        for name_id, count in shared.items():
+            name = self.names[name_id]
+            if name is None or count < needed:
+                continue
+            dist = self.distance(query, name, max_distance)
+            if dist <= max_distance:
+                matches.append((dist, name))
+        matches.sort()
+        return [name for _, name in matches[:limit]]
+
+    def phonetic(self, query: str, limit: int = 10) -> List[str]:
+        codes = {self.soundex(word) for word in query.split()} - {""}
+        if not codes:
+            return []
+        candidates = None
+        for code in codes:
+            ids = set(self.sounds.get(code, ()))
+            candidates = ids if candidates is None else candidates & ids
+        names = sorted(self.names[i] for i in candidates if self.names[i] is not None)
+        return names[:limit]
+
+    def suggest(self, query: str, limit: int = 10) -> List[str]:
+        suggestions = []
+        for name in self.prefix(query, limit) + self.fuzzy(query, limit=limit) + self.phonetic(query, limit):
+            if name not in suggestions:
+                suggestions.append(name)
+        return suggestions[:limit]
+
+class ContactDeduplicator:
+    """Finds near-duplicate contacts without comparing every pair.
+
+    Contacts are grouped into blocks by normalized phone, normalized email
+    and sorted name tokens; only pairs inside the same block are compared,
+    and matches are joined into clusters with union-find.
+    """
+    # Blocks bigger than this (a shared switchboard number, a common name)
+    # are not compared pair by pair: they are sorted by a second key and
+    # each contact is only compared with the WINDOW - 1 that follow it
+    MAX_BLOCK = 50
+    WINDOW = 10
+
+    def __init__(self, contacts: Dict[str, Dict[str, str]]):
+        self.contacts = contacts
+        self._parent: Dict[str, str] = {}
+        self.reasons: Dict[str, str] = {}
+        # (block kind, shared value, size) of every block that was windowed
+        self.large_blocks: List[Tuple[str, str, int]] = []
+
+    @staticmethod
+    def normalize_phone(phone: str) -> str:
+        digits = ''.join(c for c in phone if c.isdigit())
+        return digits[-10:]
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        local, _, domain = email.strip().lower().partition('@')
+        if not domain:
+            return ""
+        return f"{local.split('+', 1)[0]}@{domain}"
+
+    @staticmethod
+    def name_key(name: str) -> str:
+        return ' '.join(sorted(name.lower().split()))
+
+    def _find(self, name: str) -> str:
+        root = name
+        while self._parent.get(root, root) != root:
+            root = self._parent[root]
+        while name != root:
+            self._parent[name], name = root, self._parent[name]
+        return root
+
+    def _union(self, a: str, b: str, reason: str):
+        self._parent.setdefault(a, a)
+        self._parent.setdefault(b, b)
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            self._parent[root_b] = root_a
+            self.reasons.setdefault(a, reason)
+            self.reasons.setdefault(b, reason)
+
+    def _match(self, a: str, b: str) -> Optional[str]:
+        info_a, info_b = self.contacts[a], self.contacts[b]
+        email_a = self.normalize_email(info_a['email'])
+        email_b = self.normalize_email(info_b['email'])
+        phone_a = self.normalize_phone(info_a['phone'])
+        phone_b = self.normalize_phone(info_b['phone'])
+        same_phone = phone_a == phone_b
+
+        if email_a and email_a == email_b:
+            return "same email"
+        if same_phone and set(a.lower().split()) & set(b.lower().split()):
+            return "same phone"
+        if self.name_key(a) == self.name_key(b) and (same_phone or not phone_a or not phone_b):
+            return "same name"
+        return None
+
+    def _pairs(self) -> Iterator[Tuple[str, str]]:
+        phone = lambda name: self.normalize_phone(self.contacts[name]['phone'])
+        email = lambda name: self.normalize_email(self.contacts[name]['email'])
+        # (kind, block key, second key used to order an oversized block)
+        keys = (
+            ('phone', phone, self.name_key),
+            ('email', email, self.name_key),
+            ('name', self.name_key, phone),
+        )
+        for kind, key, second in keys:
+            blocks: Dict[str, List[str]] = {}
+            for name in self.contacts:
+                block_key = key(name)
+                if block_key:
+                    blocks.setdefault(block_key, []).append(name)
+            for block_key, members in blocks.items():
+                if len(members) <= self.MAX_BLOCK:
+                    window = len(members)
+                else:
+                    self.large_blocks.append((kind, block_key, len(members)))
+                    members.sort(key=lambda name: (second(name), name))
+                    window = self.WINDOW
+                for i, a in enumerate(members):
+                    for b in members[i + 1:i + window]:
+                        yield a, b
+
+    def groups(self) -> List[Tuple[str, List[str]]]:
+        """Duplicate clusters as (name to keep, names to merge into it)."""
+        for a, b in self._pairs():
+            reason = self._match(a, b)
+            if reason:
+                self._union(a, b, reason)
+
+        clusters: Dict[str, List[str]] = {}
+        for name in self._parent:
+            clusters.setdefault(self._find(name), []).append(name)
+
+        groups = []
+        for members in clusters.values():
+            # Prefer the canonical lowercase spelling, then the most complete record
+            keep = max(members, key=lambda n: (n == n.lower().strip(),
+                                               bool(self.contacts[n]['email']), len(n), n))
+            groups.append((keep, sorted(n for n in members if n != keep)))
+        return sorted(groups)
+
+    def merge(self, groups: List[Tuple[str, List[str]]]) -> List[str]:
+        """Fold each group into its kept contact; returns the removed names."""
+        removed = []
+        for keep, duplicates in groups:
+            info = self.contacts[keep]
+            for name in duplicates:
+                duplicate = self.contacts.pop(name)
+                info['phone'] = info['phone'] or duplicate['phone']
+                info['email'] = info['email'] or duplicate['email']
+                removed.append(name)
+        return removed
+
 class ContactManager:
     FILE = "contacts.csv"
     FIELDS = ["name", "phone", "email"]
 
+    # Parsed contacts per file path, tagged with the (mtime, size, inode)
+    # they were read at so changes made outside this process are picked up
+    _cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Dict[str, str]]]] = {}
+    # Lookup indexes per file path, valid while they wrap the cached dict
+    _indexes: Dict[str, ContactIndex] = {}
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
     @staticmethod
     def _load() -> Dict[str, Dict[str, str]]:
+        path = os.path.abspath(ContactManager.FILE)
+        signature = ContactManager._signature(path)
+        if signature is None:
+            ContactManager._cache.pop(path, None)
+            return {}
+
+        cached = ContactManager._cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
         contacts = {}
-        if os.path.exists(ContactManager.FILE):
-            try:
-                with open(ContactManager.FILE, newline="", encoding='utf-8') as f:
-                    reader = csv.DictReader(f, fieldnames=ContactManager.FIELDS)
-                    for row in reader:
-                        contacts[row['name']] = {
-                            'phone': row['phone'],
-                            'email': row['email']
-                        }
-            except (csv.Error, IOError) as e:
-                print(f"⚠️ Error loading contacts: {str(e)}")
+        try:
+            with open(path, newline="", encoding='utf-8') as f:
+                reader = csv.DictReader(f, fieldnames=ContactManager.FIELDS)
+                for row in reader:
+                    contacts[row['name']] = {
+                        'phone': row['phone'],
+                        'email': row['email']
+                    }
+            ContactManager._cache[path] = (signature, contacts)
+        except (csv.Error, IOError) as e:
+            print(f"⚠️ Error loading contacts: {str(e)}")
         return contacts
 
     @staticmethod
     def _save(contacts: Dict[str, Dict[str, str]]):
+        path = os.path.abspath(ContactManager.FILE)
         try:
-            with open(ContactManager.FILE, "w", newline="", encoding='utf-8') as f:
+            with open(path, "w", newline="", encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=ContactManager.FIELDS)
                 for name, info in contacts.items():
                     writer.writerow({
@@ -40,7 +340,25 @@ class ContactManager:
                         'email': info['email']
                     })
         except IOError as e:
+            # The cached dict may have been edited in place; force a re-read
+            ContactManager._cache.pop(path, None)
             print(f"⚠️ Error saving contacts: {str(e)}")
+            return
+
+        signature = ContactManager._signature(path)
+        if signature is not None:
+            ContactManager._cache[path] = (signature, contacts)
+
+    @staticmethod
+    def _index(contacts: Dict[str, Dict[str, str]], build: bool = True) -> Optional[ContactIndex]:
+        path = os.path.abspath(ContactManager.FILE)
+        index = ContactManager._indexes.get(path)
+        if index is None or index.contacts is not contacts:
+            if not build:
+                return None
+            index = ContactIndex(contacts)
+            ContactManager._indexes[path] = index
+        return index
 
     @classmethod
     def _validate_phone(cls, phone: str) -> bool:
@@ -71,6 +389,9 @@ class ContactManager:
                 return
 
             contacts[name] = {"phone": phone, "email": email}
+            index = cls._index(contacts, build=False)
+            if index:
+                index.add(name)
             cls._save(contacts)
             print("✅ Contact added successfully!")
             
@@ -98,7 +419,18 @@ class ContactManager:
         name = input("Search name: ").lower().strip()
         contacts = cls._load()
         contact = contacts.get(name)
-        
+
+        if not contact and name:
+            suggestions = cls._index(contacts).suggest(name)
+            if suggestions:
+                print("\n🤔 Did you mean:")
+                for idx, suggestion in enumerate(suggestions, 1):
+                    print(f"{idx}. {suggestion}")
+                choice = input("Select number (Enter to cancel): ").strip()
+                if choice.isdigit() and 1 <= int(choice) <= len(suggestions):
+                    name = suggestions[int(choice) - 1]
+                    contact = contacts[name]
+
         if contact:
             print("\n🔍 Contact Found:")
             print(f"Name: {name}")
@@ -116,11 +448,171 @@ class ContactManager:
             confirm = input(f"Are you sure you want to delete {name}? (y/n): ").lower()
             if confirm == 'y':
                 del contacts[name]
+                index = cls._index(contacts, build=False)
+                if index:
+                    index.remove(name)
                 cls._save(contacts)
                 print("✅ Contact deleted successfully!")
         else:
             print("❌ Contact not found.")
 
+    @classmethod
+    def merge_duplicates(cls, contacts: Dict[str, Dict[str, str]],
+                         groups: List[Tuple[str, List[str]]]) -> int:
+        removed = ContactDeduplicator(contacts).merge(groups)
+        index = cls._index(contacts, build=False)
+        if index:
+            for name in removed:
+                index.remove(name)
+        cls._save(contacts)
+        return len(removed)
+
+    @classmethod
+    def deduplicate(cls, auto_merge: bool = False):
+        contacts = cls._load()
+        deduplicator = ContactDeduplicator(contacts)
+        groups = deduplicator.groups()
+        for kind, value, size in deduplicator.large_blocks:
+            print(f"⚠️ {size} contacts share the {kind} '{value}'; only neighbouring entries "
+                  f"among them were compared ({ContactDeduplicator.WINDOW} at a time).")
+        if not groups:
+            print("✅ No duplicate contacts found.")
+            return
+
+        print(f"\n🧬 {len(groups)} possible duplicate groups:")
+        print("-" * 40)
+        for keep, duplicates in groups:
+            merged = ', '.join(f"{name} ({deduplicator.reasons[name]})" for name in duplicates)
+            print(f"{keep} ⇐ {merged}")
+
+        if auto_merge or input("\nMerge all suggestions? (y/n): ").lower() == 'y':
+            removed = cls.merge_duplicates(contacts, groups)
+            print(f"✅ Merged {removed} duplicate contacts.")
+
+    @staticmethod
+    def _read_vcards(file) -> Iterator[Tuple[str, str, str]]:
+        def unfolded():
+            previous = None
+            for line in file:
+                line = line.rstrip('\r\n')
+                # RFC 6350 folding: a leading space or tab continues the previous line
+                if line[:1] in (' ', '\t') and previous is not None:
+                    previous += line[1:]
+                    continue
+                if previous is not None:
+                    yield previous
+                previous = line
+            if previous is not None:
+                yield previous
+
+        card = None
+        for line in unfolded():
+            key, _, value = line.partition(':')
+            prop = key.split(';', 1)[0].upper()
+            if prop == 'BEGIN' and value.upper() == 'VCARD':
+                card = {'name': '', 'phone': '', 'email': ''}
+            elif card is None:
+                continue
+            elif prop == 'END':
+                yield card['name'], card['phone'], card['email']
+                card = None
+            elif prop == 'FN':
+                card['name'] = value.replace('\\,', ',').replace('\\;', ';')
+            elif prop == 'N' and not card['name']:
+                # N is "family;given;..." and only used when FN is missing
+                parts = value.split(';')
+                card['name'] = ' '.join(p for p in parts[1:2] + parts[:1] if p)
+            elif prop == 'TEL' and not card['phone']:
+                card['phone'] = value
+            elif prop == 'EMAIL' and not card['email']:
+                card['email'] = value
+
+    @staticmethod
+    def _read_csv(file) -> Iterator[Tuple[str, str, str]]:
+        reader = csv.reader(file)
+        first = next(reader, None)
+        if first is None:
+            return
+        header = [field.strip().lower() for field in first]
+        if 'name' in header and 'phone' in header:
+            positions = [header.index(field) if field in header else None
+                         for field in ContactManager.FIELDS]
+        else:
+            positions = [0, 1, 2]
+            reader = chain([first], reader)
+        for row in reader:
+            yield tuple(row[i] if i is not None and i < len(row) else ''
+                        for i in positions)
+
+    @classmethod
+    def bulk_import(cls, path: str) -> Tuple[int, int, int]:
+        """Stream a .vcf or .csv file into the contacts; returns (added, skipped, rejected).
+
+        New rows are staged and only merged once the whole file has been
+        read, so a read error part way through leaves the contacts untouched.
+        """
+        vcard = path.lower().endswith(('.vcf', '.vcard'))
+        contacts = cls._load()
+        staged: Dict[str, Dict[str, str]] = {}
+        skipped = rejected = 0
+
+        with open(path, newline='', encoding='utf-8') as f:
+            records = cls._read_vcards(f) if vcard else cls._read_csv(f)
+            for name, phone, email in records:
+                name = name.lower().strip()
+                phone = ''.join(c for c in phone if c.isdigit())
+                email = email.strip()
+                if not name or not cls._validate_phone(phone) or (email and not cls._validate_email(email)):
+                    rejected += 1
+                    continue
+                if name in contacts or name in staged:
+                    skipped += 1
+                    continue
+                staged[name] = {'phone': phone, 'email': email}
+
+        if staged:
+            index = cls._index(contacts, build=False)
+            contacts.update(staged)
+            if index:
+                index.add_all(staged)
+            cls._save(contacts)
+        return len(staged), skipped, rejected
+
+    @classmethod
+    def bulk_export(cls, path: str) -> int:
+        contacts = cls._load()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            if path.lower().endswith(('.vcf', '.vcard')):
+                for name, info in contacts.items():
+                    name = name.replace(',', '\\,').replace(';', '\\;')
+                    f.write(f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:{name}\r\nTEL:{info['phone']}\r\n")
+                    if info['email']:
+                        f.write(f"EMAIL:{info['email']}\r\n")
+                    f.write("END:VCARD\r\n")
+            else:
+                writer = csv.writer(f)
+                writer.writerow(cls.FIELDS)
+                writer.writerows((name, info['phone'], info['email']) for name, info in contacts.items())
+        return len(contacts)
+
+    @classmethod
+    def import_contacts(cls):
+        path = input("Import file (.vcf or .csv): ").strip()
+        try:
+            added, skipped, rejected = cls.bulk_import(path)
+            print(f"✅ Imported {added} contacts ({skipped} already existed, {rejected} invalid)")
+        except (csv.Error, IOError, UnicodeDecodeError) as e:
+            print(f"❌ Error importing contacts: {str(e)}")
+
+    @classmethod
+    def export_contacts(cls):
+        path = input("Export file (.vcf or .csv): ").strip()
+        try:
+            count = cls.bulk_export(path)
+            print(f"✅ Exported {count} contacts to {path}")
+        except (csv.Error, IOError) as e:
+            print(f"❌ Error exporting contacts: {str(e)}")
+
 def main():
     manager = ContactManager()
     menu = {
@@ -128,7 +620,10 @@ def main():
         '2': ('View All Contacts', manager.show_contacts),
         '3': ('Search Contact', manager.find_contact),
         '4': ('Delete Contact', manager.delete_contact),
-        '5': ('Exit', exit)
+        '5': ('Find Duplicates', manager.deduplicate),
+        '6': ('Import Contacts', manager.import_contacts),
+        '7': ('Export Contacts', manager.export_contacts),
+        '8': ('Exit', exit)
     }
 
     while True:
@@ -138,8 +633,8 @@ def main():
             print(f"{key}. {desc}")
             
         try:
-            choice = input("\nEnter your choice (1-5): ")
-            if choice == '5':
+            choice = input("\nEnter your choice (1-8): ")
+            if choice == '8':
                 print("👋 Goodbye!")
                 break
                 
@@ -1,6 +1,13 @@
+import calendar
 import json
-from datetime import datetime
-from typing import Dict, List
+import os
+import tempfile
+import threading
+import time
+from datetime import date as Date, datetime, timedelta
+from typing import Dict, Iterator, List, Set, Union
+
+DATE_FORMAT = "%Y/%m/%d"
 
 class Task:
     def __init__(self, title: str, description: str = ""):
@@ -13,14 +20,190 @@ class Task:
         status = "✓" if self.completed else "✗"
         return f"[{status}] {self.title} - {self.description}"
 
+    def to_dict(self) -> dict:
+        return {
+            'title': self.title,
+            'description': self.description,
+            'completed': self.completed,
+            'created_at': self.created_at.isoformat()
+        }
+
+class RecurringTask:
+    """A task stored once and expanded into dated occurrences on demand."""
+    PATTERNS = ('daily', 'weekdays', 'weekly', 'monthly')
+
+    def __init__(self, title: str, description: str, pattern: str, start: str,
+                 interval: int = 1, day: int = 1):
+        if pattern not in self.PATTERNS:
+            raise ValueError(f"Pattern must be one of: {', '.join(self.PATTERNS)}")
+        if interval < 1:
+            raise ValueError("Interval must be at least 1")
+        if not 1 <= day <= 31:
+            raise ValueError("Day of month must be between 1 and 31")
+        self.title = title
+        self.description = description
+        self.pattern = pattern
+        self.start = start
+        self.interval = interval
+        self.day = day
+        self.completed_on: Set[str] = set()
+        self.skipped_on: Set[str] = set()
+
+    def __str__(self):
+        every = {
+            'daily': f"every {self.interval} day(s)",
+            'weekdays': "every weekday",
+            'weekly': f"every {self.interval} week(s)",
+            'monthly': f"every {self.interval} month(s) on day {self.day}",
+        }[self.pattern]
+        return f"🔁 {self.title} - {every} from {self.start}"
+
+    def _dates(self, first: Date, last: Date) -> Iterator[Date]:
+        start = datetime.strptime(self.start, DATE_FORMAT).date()
+        first = max(first, start)
+        if first > last:
+            return
+
+        if self.pattern == 'weekdays':
+            current = first
+            while current <= last:
+                if current.weekday() < 5:
+                    yield current
+                current += timedelta(days=1)
+        elif self.pattern == 'monthly':
+            month = (first.year * 12 + first.month - 1)
+            offset = (month - (start.year * 12 + start.month - 1)) % self.interval
+            month += (self.interval - offset) % self.interval
+            while True:
+                year, month_idx = divmod(month, 12)
+                if Date(year, month_idx + 1, 1) > last:
+                    return
+                # Short months fall back to their last day
+                days_in_month = calendar.monthrange(year, month_idx + 1)[1]
+                current = Date(year, month_idx + 1, min(self.day, days_in_month))
+                if first <= current <= last:
+                    yield current
+                month += self.interval
+        else:
+            period = self.interval * (7 if self.pattern == 'weekly' else 1)
+            current = first + timedelta(days=-(first - start).days % period)
+            step = timedelta(days=period)
+            while current <= last:
+                yield current
+                current += step
+
+    def occurrences(self, first: Date, last: Date) -> Iterator[str]:
+        for day in self._dates(first, last):
+            key = day.strftime(DATE_FORMAT)
+            if key not in self.skipped_on:
+                yield key
+
+    def to_dict(self) -> dict:
+        return {
+            'title': self.title,
+            'description': self.description,
+            'pattern': self.pattern,
+            'start': self.start,
+            'interval': self.interval,
+            'day': self.day,
+            'completed_on': sorted(self.completed_on),
+            'skipped_on': sorted(self.skipped_on)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RecurringTask':
+        rule = cls(data['title'], data['description'], data['pattern'], data['start'],
+                   data.get('interval', 1), data.get('day', 1))
+        rule.completed_on = set(data.get('completed_on', []))
+        rule.skipped_on = set(data.get('skipped_on', []))
+        return rule
+
+class Occurrence:
+    """One date of a RecurringTask; completion is tracked on the rule."""
+
+    def __init__(self, rule: RecurringTask, date: str):
+        self.rule = rule
+        self.date = date
+
+    @property
+    def title(self) -> str:
+        return self.rule.title
+
+    @property
+    def description(self) -> str:
+        return self.rule.description
+
+    @property
+    def completed(self) -> bool:
+        return self.date in self.rule.completed_on
+
+    @completed.setter
+    def completed(self, value: bool):
+        if value:
+            self.rule.completed_on.add(self.date)
+        else:
+            self.rule.completed_on.discard(self.date)
+
+    def __str__(self):
+        status = "✓" if self.completed else "✗"
+        return f"[{status}] 🔁 {self.title} - {self.description}"
+
+class AutoSaver(threading.Thread):
+    """Background writer that flushes dirty dates once edits go quiet."""
+
+    def __init__(self, manager, delay: float):
+        super().__init__(daemon=True)
+        self.manager = manager
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._last_edit = None
+        self._stopped = False
+
+    def touch(self):
+        with self._cond:
+            self._last_edit = time.monotonic()
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self.join()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._last_edit is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                idle = time.monotonic() - self._last_edit
+                if idle < self.delay:
+                    # Another edit may arrive meanwhile and push the deadline back
+                    self._cond.wait(self.delay - idle)
+                    continue
+                self._last_edit = None
+            self.manager._flush()
+        self.manager._flush()
+
 class DailyTaskManager:
     FILE = 'daily_tasks.json'
+    AUTOSAVE_DELAY = 2.0
+    RULES_KEY = 'recurring'
     tasks: Dict[str, List[Task]] = {}
+    rules: List[RecurringTask] = []
+
+    # Serialized JSON per date; only dirty dates are re-encoded on flush
+    _shards: Dict[str, str] = {}
+    _dirty: Set[str] = set()
+    _lock = threading.RLock()
+    _write_lock = threading.Lock()
+    _saver = None
 
     @classmethod
     def _validate_date(cls, date_str: str) -> str:
         try:
-            datetime.strptime(date_str, "%Y/%m/%d")
+            datetime.strptime(date_str, DATE_FORMAT)
             return date_str
         except ValueError:
             raise ValueError("Invalid date format (YYYY/MM/DD)")
@@ -34,17 +217,74 @@ class DailyTaskManager:
                 raise ValueError("Title cannot be empty")
                 
             description = input("Description: ").strip()
-            cls.tasks.setdefault(date, []).append(Task(title, description))
+            with cls._lock:
+                cls.tasks.setdefault(date, []).append(Task(title, description))
+            cls._mark_dirty(date)
             print("✅ Task added successfully!")
         except ValueError as e:
             print(f"❌ Error: {e}")
 
+    @classmethod
+    def add_recurring_task(cls):
+        try:
+            title = input("Title: ").strip()
+            if not title:
+                raise ValueError("Title cannot be empty")
+
+            description = input("Description: ").strip()
+            pattern = input(f"Repeat ({'/'.join(RecurringTask.PATTERNS)}): ").strip().lower()
+            start = cls._validate_date(input("Start date (YYYY/MM/DD): ").strip())
+            interval, day = 1, datetime.strptime(start, DATE_FORMAT).day
+            if pattern in ('daily', 'weekly', 'monthly'):
+                interval = int(input("Repeat every N (default 1): ").strip() or 1)
+            if pattern == 'monthly':
+                day = int(input(f"Day of month (default {day}): ").strip() or day)
+
+            rule = RecurringTask(title, description, pattern, start, interval, day)
+            with cls._lock:
+                cls.rules.append(rule)
+            cls._mark_dirty(cls.RULES_KEY)
+            print("✅ Recurring task added successfully!")
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+
+    @classmethod
+    def delete_recurring_task(cls):
+        if not cls.rules:
+            print("🔁 No recurring tasks")
+            return
+
+        for idx, rule in enumerate(cls.rules, 1):
+            print(f"{idx}. {rule}")
+        try:
+            rule_num = int(input("Recurring task number to delete: ")) - 1
+            if 0 <= rule_num < len(cls.rules):
+                with cls._lock:
+                    deleted = cls.rules.pop(rule_num)
+                cls._mark_dirty(cls.RULES_KEY)
+                print(f"✅ Deleted: {deleted.title}")
+            else:
+                print("❌ Invalid task number!")
+        except ValueError:
+            print("❌ Please enter a valid number!")
+
+    @classmethod
+    def _tasks_for(cls, date: str) -> List[Union[Task, Occurrence]]:
+        """One-off tasks for a date followed by any recurring occurrences."""
+        day = datetime.strptime(date, DATE_FORMAT).date()
+        occurrences = [
+            Occurrence(rule, date)
+            for rule in cls.rules
+            if next(rule.occurrences(day, day), None)
+        ]
+        return cls.tasks.get(date, []) + occurrences
+
     @classmethod
     def show_tasks(cls):
         date = input("Date (YYYY/MM/DD): ").strip()
         try:
             date = cls._validate_date(date)
-            tasks = cls.tasks.get(date, [])
+            tasks = cls._tasks_for(date)
             
             if not tasks:
                 print(f"📅 No tasks for {date}")
@@ -62,18 +302,27 @@ class DailyTaskManager:
         date = input("Date (YYYY/MM/DD): ").strip()
         try:
             date = cls._validate_date(date)
-            if date not in cls.tasks or not cls.tasks[date]:
+            tasks = cls._tasks_for(date)
+            if not tasks:
                 print(f"❌ No tasks for {date}")
                 return
                 
             cls.show_tasks()
             try:
                 task_num = int(input("Task number to delete: ")) - 1
-                if 0 <= task_num < len(cls.tasks[date]):
-                    deleted = cls.tasks[date].pop(task_num)
+                if 0 <= task_num < len(tasks):
+                    deleted = tasks[task_num]
+                    with cls._lock:
+                        if isinstance(deleted, Occurrence):
+                            # Only this date is removed; the rule keeps repeating
+                            deleted.rule.skipped_on.add(date)
+                            deleted.rule.completed_on.discard(date)
+                        else:
+                            cls.tasks[date].remove(deleted)
+                            if not cls.tasks[date]:
+                                del cls.tasks[date]
+                    cls._mark_dirty(cls.RULES_KEY if isinstance(deleted, Occurrence) else date)
                     print(f"✅ Deleted: {deleted.title}")
-                    if not cls.tasks[date]:
-                        del cls.tasks[date]
                 else:
                     print("❌ Invalid task number!")
             except ValueError:
@@ -86,16 +335,19 @@ class DailyTaskManager:
         date = input("Date (YYYY/MM/DD): ").strip()
         try:
             date = cls._validate_date(date)
-            if date not in cls.tasks or not cls.tasks[date]:
+            tasks = cls._tasks_for(date)
+            if not tasks:
                 print(f"❌ No tasks for {date}")
                 return
                 
             cls.show_tasks()
             try:
                 task_num = int(input("Task number to toggle: ")) - 1
-                if 0 <= task_num < len(cls.tasks[date]):
-                    task = cls.tasks[date][task_num]
-                    task.completed = not task.completed
+                if 0 <= task_num < len(tasks):
+                    task = tasks[task_num]
+                    with cls._lock:
+                        task.completed = not task.completed
+                    cls._mark_dirty(cls.RULES_KEY if isinstance(task, Occurrence) else date)
                     status = "completed" if task.completed else "pending"
                     print(f"✅ Task marked as {status}")
                 else:
@@ -107,44 +359,102 @@ class DailyTaskManager:
 
     @classmethod
     def show_summary(cls):
-        if not cls.tasks:
+        if not cls.tasks and not cls.rules:
             print("📅 No tasks available")
             return
-            
+
+        counts = {
+            date: [sum(1 for t in tasks if t.completed), len(tasks)]
+            for date, tasks in cls.tasks.items()
+        }
+        # Recurring tasks are only expanded up to today (or the last one-off date)
+        if cls.rules:
+            bounds = [datetime.strptime(date, DATE_FORMAT).date() for date in cls.tasks]
+            first = min(bounds + [datetime.strptime(r.start, DATE_FORMAT).date() for r in cls.rules])
+            last = max(bounds + [Date.today()])
+            for rule in cls.rules:
+                for date in rule.occurrences(first, last):
+                    count = counts.setdefault(date, [0, 0])
+                    count[0] += date in rule.completed_on
+                    count[1] += 1
+
         print("\n📅 Task Summary:")
         print("-" * 40)
-        for date in sorted(cls.tasks.keys()):
-            total = len(cls.tasks[date])
-            completed = sum(1 for t in cls.tasks[date] if t.completed)
+        for date in sorted(counts.keys()):
+            completed, total = counts[date]
             print(f"{date}: {completed}/{total} tasks completed")
 
     @classmethod
-    def save_to_file(cls):
+    def _mark_dirty(cls, date: str):
+        with cls._lock:
+            cls._dirty.add(date)
+        if cls._saver is None:
+            cls._saver = AutoSaver(cls, cls.AUTOSAVE_DELAY)
+            cls._saver.start()
+        cls._saver.touch()
+
+    @classmethod
+    def _write_atomic(cls, content: str):
+        directory = os.path.dirname(os.path.abspath(cls.FILE))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
         try:
-            data = {
-                date: [
-                    {
-                        'title': task.title,
-                        'description': task.description,
-                        'completed': task.completed,
-                        'created_at': task.created_at.isoformat()
-                    }
-                    for task in tasks
-                ]
-                for date, tasks in cls.tasks.items()
-            }
-            
-            with open(cls.FILE, 'w') as file:
-                json.dump(data, file, indent=2)
+            with os.fdopen(fd, 'w') as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, cls.FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def _flush(cls, force: bool = False) -> bool:
+        with cls._write_lock:
+            with cls._lock:
+                if not cls._dirty and not force:
+                    return False
+                flushed = set(cls._dirty)
+                for date in flushed:
+                    if date == cls.RULES_KEY:
+                        tasks = cls.rules
+                    else:
+                        tasks = cls.tasks.get(date)
+                    if tasks:
+                        cls._shards[date] = json.dumps([task.to_dict() for task in tasks])
+                    else:
+                        cls._shards.pop(date, None)
+                cls._dirty.clear()
+                body = ",\n".join(
+                    f"  {json.dumps(date)}: {shard}"
+                    for date, shard in sorted(cls._shards.items())
+                )
+            try:
+                cls._write_atomic("{\n" + body + "\n}\n")
+            except IOError as e:
+                with cls._lock:
+                    cls._dirty.update(flushed)
+                print(f"❌ Error autosaving tasks: {e}")
+                return False
+            return True
+
+    @classmethod
+    def save_to_file(cls):
+        if cls._flush(force=True):
             print("💾 Tasks saved successfully!")
-        except IOError as e:
-            print(f"❌ Error saving tasks: {e}")
+
+    @classmethod
+    def shutdown(cls):
+        if cls._saver is not None:
+            cls._saver.stop()
+            cls._saver = None
 
     @classmethod
     def load_from_file(cls):
         try:
             with open(cls.FILE, 'r') as file:
                 data = json.load(file)
+                cls._shards = {key: json.dumps(value) for key, value in data.items()}
+                cls.rules = [RecurringTask.from_dict(rule) for rule in data.pop(cls.RULES_KEY, [])]
                 cls.tasks = {
                     date: [
                         Task(
@@ -161,9 +471,10 @@ class DailyTaskManager:
                     for i, task_data in enumerate(tasks):
                         cls.tasks[date][i].completed = task_data['completed']
                         cls.tasks[date][i].created_at = datetime.fromisoformat(task_data['created_at'])
+                cls._dirty = set()
         except FileNotFoundError:
             print("ℹ️ No existing task file found")
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"❌ Error loading tasks: {e}")
 
 def main():
@@ -175,8 +486,10 @@ def main():
         '3': ('Delete Task', DailyTaskManager.delete_task),
         '4': ('Toggle Completion', DailyTaskManager.toggle_completion),
         '5': ('Task Summary', DailyTaskManager.show_summary),
-        '6': ('Save', DailyTaskManager.save_to_file),
-        '7': ('Exit', None)
+        '6': ('Add Recurring Task', DailyTaskManager.add_recurring_task),
+        '7': ('Delete Recurring Task', DailyTaskManager.delete_recurring_task),
+        '8': ('Save', DailyTaskManager.save_to_file),
+        '9': ('Exit', None)
     }
 
     while True:
@@ -185,9 +498,10 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
             
-        choice = input("\nEnter choice (1-7): ")
-        if choice == '7':
+        choice = input("\nEnter choice (1-9): ")
+        if choice == '9':
             DailyTaskManager.save_to_file()
+            DailyTaskManager.shutdown()
             print("👋 Goodbye!")
             break
         if choice in menu:
@@ -1,4 +1,33 @@
-from typing import List, Dict
+import heapq
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left, insort
+from datetime import date as Date, timedelta
+from typing import Iterator, List, Dict, Optional
+
+def read_journal(path: str) -> Iterator[dict]:
+    """Yield the complete JSON lines of a journal, then cut off a torn tail.
+
+    A crash mid-append leaves a partial last line; if it stayed, the next
+    append would be glued onto it and lost along with it on the next load.
+    """
+    good = 0
+    with open(path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            good += len(line)
+            yield entry
+    if os.path.getsize(path) > good:
+        with open(path, 'r+b') as file:
+            file.truncate(good)
+            os.fsync(file.fileno())
 
 class Book:
     def __init__(self, title: str, author: str, copies: int = 1):
@@ -9,15 +38,402 @@ class Book:
     def __str__(self):
         return f"'{self.title}' by {self.author} - Copies: {self.copies}"
 
+class Loan:
+    def __init__(self, loan_id: int, title: str, borrower: str, borrowed: Date, due: Date):
+        self.loan_id = loan_id
+        self.title = title
+        self.borrower = borrower
+        self.borrowed = borrowed
+        self.due = due
+        self.returned: Optional[Date] = None
+
+    def days_overdue(self, today: Date) -> int:
+        return max((today - self.due).days, 0)
+
+    def __str__(self):
+        status = f"returned {self.returned}" if self.returned else f"due {self.due}"
+        return f"#{self.loan_id} '{self.title}' - {self.borrower} ({status})"
+
+class LoanLedger:
+    """Per-copy loans with due dates and an append-only history file.
+
+    Open loans sit in a min-heap keyed on due date. A sweep pops only the
+    entries that have come due since the last sweep and moves them into the
+    overdue set, so it costs O(k log n) for k newly overdue loans. Returned
+    loans are left in the heap and skipped when they surface.
+
+    Which loans are open is recorded by the catalog: borrow and return ops
+    carry the loan fields, so one journal record covers both the copy
+    count and the loan, and snapshots include the open loans. The history
+    file is an append-only log of every loan event, written after the
+    catalog record.
+    """
+
+    def __init__(self, path: str = 'loans.jsonl'):
+        self.path = path
+        self.next_id = 1
+        self.open: Dict[int, Loan] = {}
+        self.overdue: Dict[int, Loan] = {}
+        self.by_borrower: Dict[str, Dict[int, Loan]] = {}
+        self._due: List[tuple] = []
+
+    def _append(self, event: dict):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event) + '\n')
+
+    def history(self, op: dict):
+        """Append a committed borrow/return op to the history file."""
+        if op['op'] == 'borrow':
+            self._append({'event': 'borrow', 'loan': op['loan'], 'title': op['title'],
+                          'borrower': op['borrower'], 'borrowed': op['borrowed'], 'due': op['due']})
+        else:
+            self._append({'event': 'return', 'loan': op['loan'], 'returned': op['returned']})
+
+    def _open(self, loan: Loan):
+        self.open[loan.loan_id] = loan
+        self.by_borrower.setdefault(loan.borrower.casefold(), {})[loan.loan_id] = loan
+        heapq.heappush(self._due, (loan.due, loan.loan_id))
+        self.next_id = max(self.next_id, loan.loan_id + 1)
+
+    def _close(self, loan: Loan, returned: Date):
+        loan.returned = returned
+        del self.open[loan.loan_id]
+        self.overdue.pop(loan.loan_id, None)
+        loans = self.by_borrower[loan.borrower.casefold()]
+        del loans[loan.loan_id]
+        if not loans:
+            del self.by_borrower[loan.borrower.casefold()]
+
+    def borrow_op(self, title: str, borrower: str, days: int, today: Date) -> dict:
+        return {'op': 'borrow', 'title': title, 'loan': self.next_id, 'borrower': borrower,
+                'borrowed': today.isoformat(), 'due': (today + timedelta(days=days)).isoformat()}
+
+    @staticmethod
+    def return_op(loan: Loan, today: Date) -> dict:
+        return {'op': 'return', 'title': loan.title, 'loan': loan.loan_id, 'returned': today.isoformat()}
+
+    def apply(self, op: dict) -> bool:
+        """Open or close the loan named by a catalog op; False if that already happened."""
+        if op['op'] == 'borrow':
+            if op['loan'] < self.next_id:
+                return False
+            self._open(Loan(op['loan'], op['title'], op['borrower'],
+                            Date.fromisoformat(op['borrowed']), Date.fromisoformat(op['due'])))
+            return True
+        loan = self.open.get(op['loan'])
+        if loan is None:
+            return False
+        self._close(loan, Date.fromisoformat(op['returned']))
+        return True
+
+    def rows(self) -> dict:
+        return {'next': self.next_id,
+                'open': [[loan.loan_id, loan.title, loan.borrower, loan.borrowed.isoformat(),
+                          loan.due.isoformat()] for loan in self.open.values()]}
+
+    def restore(self, rows: dict):
+        for loan_id, title, borrower, borrowed, due in rows['open']:
+            self._open(Loan(loan_id, title, borrower, Date.fromisoformat(borrowed), Date.fromisoformat(due)))
+        self.next_id = max(self.next_id, rows['next'])
+
+    def find(self, title: str, borrower: str) -> Optional[Loan]:
+        """The borrower's open loan of a title that is due first."""
+        loans = [loan for loan in self.by_borrower.get(borrower.casefold(), {}).values()
+                 if loan.title.casefold() == title.casefold()]
+        return min(loans, key=lambda loan: loan.due) if loans else None
+
+    def sweep(self, today: Date) -> List[Loan]:
+        """Move loans that have come due before `today` into `overdue`; returns the new ones."""
+        newly = []
+        while self._due and self._due[0][0] < today:
+            _, loan_id = heapq.heappop(self._due)
+            loan = self.open.get(loan_id)
+            if loan is not None:
+                self.overdue[loan_id] = loan
+                newly.append(loan)
+        return newly
+
+    def reminders(self, today: Date) -> List[str]:
+        self.sweep(today)
+        return [f"Dear {loan.borrower}, '{loan.title}' was due on {loan.due} "
+                f"({loan.days_overdue(today)} days overdue). Please return it."
+                for loan in sorted(self.overdue.values(), key=lambda loan: loan.due)]
+
+    def load(self):
+        """Rebuild the open loans from the history file (for catalogs saved without them)."""
+        if not os.path.exists(self.path):
+            return
+        for event in read_journal(self.path):
+            if event['event'] == 'borrow':
+                self._open(Loan(event['loan'], event['title'], event['borrower'],
+                                Date.fromisoformat(event['borrowed']), Date.fromisoformat(event['due'])))
+            elif event['event'] == 'return' and event['loan'] in self.open:
+                self._close(self.open[event['loan']], Date.fromisoformat(event['returned']))
+
+class CatalogStore:
+    """Catalog persistence: a JSON snapshot plus a journal of operations.
+
+    Every add/borrow/return is appended to the journal with a sequence
+    number, and the snapshot records the last sequence number it contains,
+    so startup loads the snapshot and replays only the journal entries after
+    it. Compaction first rotates the journal aside, which means new
+    operations keep appending while the snapshot is being written.
+    """
+
+    def __init__(self, snapshot: str = 'library.json', journal: str = 'library.journal'):
+        self.snapshot = snapshot
+        self.journal = journal
+        self.rotated = journal + '.1'
+        self.seq = 0
+        self.since_snapshot = 0
+        self._file = None
+
+    def record(self, op: dict):
+        if self._file is None:
+            self._file = open(self.journal, 'a', encoding='utf-8')
+        self.seq += 1
+        self._file.write(json.dumps(dict(op, seq=self.seq)) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.since_snapshot += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def rotate(self) -> int:
+        """Move the live journal aside; returns the sequence number it ends at."""
+        self.close()
+        if os.path.exists(self.journal):
+            if os.path.exists(self.rotated):
+                # A previous compaction failed; keep its entries in front
+                with open(self.rotated, 'a', encoding='utf-8') as old, \
+                        open(self.journal, 'r', encoding='utf-8') as new:
+                    old.write(new.read())
+                os.remove(self.journal)
+            else:
+                os.replace(self.journal, self.rotated)
+        self.since_snapshot = 0
+        return self.seq
+
+    def write_snapshot(self, seq: int, books: List[list], loans: dict):
+        directory = os.path.dirname(os.path.abspath(self.snapshot))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump({'seq': seq, 'books': books, 'loans': loans}, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.snapshot)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if os.path.exists(self.rotated):
+            os.remove(self.rotated)
+
+    def load(self, bulk, apply) -> bool:
+        """Pass the snapshot's [title, author, copies] rows and open loans (None
+        if it has none) to `bulk`, then each journal operation after it to
+        `apply`; False if nothing is stored."""
+        found = False
+        loans = None
+        if os.path.exists(self.snapshot):
+            with open(self.snapshot, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            self.seq = data['seq']
+            books, loans = data['books'], data.get('loans')
+            found = True
+        else:
+            books = []
+        bulk(books, loans)
+        snapshot_seq = self.seq
+        for path in (self.rotated, self.journal):
+            if not os.path.exists(path):
+                continue
+            found = True
+            for op in read_journal(path):
+                if op['seq'] > snapshot_seq:
+                    apply(op)
+                    self.seq = op['seq']
+                    self.since_snapshot += 1
+        return found
+
+class Compactor(threading.Thread):
+    """Background thread that rewrites the catalog snapshot when asked."""
+
+    def __init__(self, library):
+        super().__init__(daemon=True)
+        self.library = library
+        self._cond = threading.Condition()
+        self._requested = False
+        self._stopped = False
+
+    def request(self):
+        with self._cond:
+            self._requested = True
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self.join()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._requested and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                self._requested = False
+            self.library.compact()
+
 class Library:
+    LOAN_DAYS = 14
+    # Journal entries that trigger a background snapshot
+    COMPACT_EVERY = 5000
     books: List[Book] = []
+    ledger = LoanLedger()
+    store = CatalogStore()
+    _lock = threading.RLock()
+    _compact_lock = threading.Lock()
+    _compactor: Optional[Compactor] = None
+    # Case-folded title -> book, and case-folded author -> that author's books.
+    # The sorted key lists back prefix searches via bisect.
+    by_title: Dict[str, Book] = {}
+    by_author: Dict[str, List[Book]] = {}
+    title_keys: List[str] = []
+    author_keys: List[str] = []
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return ' '.join(text.casefold().split())
 
     @classmethod
     def _find_book(cls, title: str) -> Book:
-        for book in cls.books:
-            if book.title.lower() == title.lower():
-                return book
-        return None
+        return cls.by_title.get(cls._key(title))
+
+    @classmethod
+    def _register(cls, book: Book):
+        title_key, author_key = cls._key(book.title), cls._key(book.author)
+        cls.books.append(book)
+        cls.by_title[title_key] = book
+        insort(cls.title_keys, title_key)
+        if author_key not in cls.by_author:
+            cls.by_author[author_key] = []
+            insort(cls.author_keys, author_key)
+        cls.by_author[author_key].append(book)
+
+    @classmethod
+    def _apply(cls, op: dict) -> bool:
+        """Apply a catalog op; True if it opened or closed a loan."""
+        book = cls._find_book(op['title'])
+        if op['op'] == 'add':
+            if book:
+                book.copies += op['copies']
+            else:
+                cls._register(Book(op['title'], op['author'], op['copies']))
+        elif op['op'] == 'borrow':
+            book.copies -= 1
+        elif op['op'] == 'return':
+            book.copies += 1
+        return 'loan' in op and cls.ledger.apply(op)
+
+    @classmethod
+    def _commit(cls, op: dict):
+        """Journal an operation, then apply it."""
+        with cls._lock:
+            cls.store.record(op)
+            if cls._apply(op):
+                try:
+                    cls.ledger.history(op)
+                except OSError as e:
+                    # The catalog journal already holds the loan
+                    print(f"⚠️ Error writing loan history: {e}")
+            if cls.store.since_snapshot >= cls.COMPACT_EVERY and cls._compactor is not None:
+                cls._compactor.request()
+
+    @classmethod
+    def compact(cls):
+        with cls._compact_lock:
+            with cls._lock:
+                seq = cls.store.rotate()
+                rows = [[book.title, book.author, book.copies] for book in cls.books]
+                loans = cls.ledger.rows()
+            try:
+                cls.store.write_snapshot(seq, rows, loans)
+            except OSError as e:
+                print(f"❌ Error writing catalog snapshot: {e}")
+
+    @classmethod
+    def load(cls) -> bool:
+        """Restore the catalog and loans and start the compactor; False for a fresh library."""
+        try:
+            found = cls.store.load(cls._restore, cls._apply)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Error loading library: {e}")
+            found = False
+        if cls._compactor is None:
+            cls._compactor = Compactor(cls)
+            cls._compactor.start()
+        return found
+
+    @classmethod
+    def shutdown(cls):
+        if cls._compactor is not None:
+            cls._compactor.stop()
+            cls._compactor = None
+        cls.compact()
+        cls.store.close()
+
+    @classmethod
+    def _restore(cls, rows: List[list], loans: Optional[dict]):
+        """Load a snapshot: its books, and its open loans or, for snapshots
+        written before it held them, the loans in the history file."""
+        cls._register_all(rows)
+        if loans is None:
+            cls.ledger.load()
+        else:
+            cls.ledger.restore(loans)
+
+    @classmethod
+    def _register_all(cls, rows: List[list]):
+        """Bulk version of _register: index every book, then sort the key lists once."""
+        for title, author, copies in rows:
+            book = Book(title, author, copies)
+            title_key = cls._key(title)
+            if title_key in cls.by_title:
+                cls.by_title[title_key].copies += copies
+                continue
+            cls.books.append(book)
+            cls.by_title[title_key] = book
+            cls.by_author.setdefault(cls._key(author), []).append(book)
+        cls.title_keys = sorted(cls.by_title)
+        cls.author_keys = sorted(cls.by_author)
+
+    @staticmethod
+    def _with_prefix(keys: List[str], prefix: str) -> List[str]:
+        matches = []
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            matches.append(keys[i])
+        return matches
+
+    @classmethod
+    def find_by_author(cls, author: str) -> List[Book]:
+        """Books by an exact author name, or by every author starting with it."""
+        key = cls._key(author)
+        if key in cls.by_author:
+            return list(cls.by_author[key])
+        return [book for match in cls._with_prefix(cls.author_keys, key)
+                for book in cls.by_author[match]]
+
+    @classmethod
+    def find_by_title_prefix(cls, prefix: str) -> List[Book]:
+        return [cls.by_title[key] for key in cls._with_prefix(cls.title_keys, cls._key(prefix))]
 
     @classmethod
     def add_book(cls):
@@ -40,11 +456,14 @@ class Library:
             return
 
         existing = cls._find_book(title)
+        try:
+            cls._commit({'op': 'add', 'title': title, 'author': author, 'copies': copies})
+        except OSError as e:
+            print(f"❌ Error saving book: {e}")
+            return
         if existing:
-            existing.copies += copies
             print(f"✅ Added {copies} copies to existing book")
         else:
-            cls.books.append(Book(title, author, copies))
             print("✅ New book added successfully!")
 
     @classmethod
@@ -53,8 +472,20 @@ class Library:
         book = cls._find_book(title)
         if book:
             if book.copies > 0:
-                book.copies -= 1
-                print(f"✅ Borrowed '{book.title}'. Remaining copies: {book.copies}")
+                borrower = input("Borrower name: ").strip()
+                if not borrower:
+                    print("❌ Borrower cannot be empty!")
+                    return
+                try:
+                    with cls._lock:
+                        op = cls.ledger.borrow_op(book.title, borrower, cls.LOAN_DAYS, Date.today())
+                        cls._commit(op)
+                except OSError as e:
+                    print(f"❌ Error recording loan: {e}")
+                    return
+                loan = cls.ledger.open[op['loan']]
+                print(f"✅ Borrowed '{book.title}' (loan #{loan.loan_id}), due {loan.due}. "
+                      f"Remaining copies: {book.copies}")
             else:
                 print("❌ No copies available!")
         else:
@@ -65,11 +496,51 @@ class Library:
         title = input("Book title: ").strip()
         book = cls._find_book(title)
         if book:
-            book.copies += 1
-            print(f"✅ Returned '{book.title}'. Total copies now: {book.copies}")
+            borrower = input("Borrower name: ").strip()
+            loan = cls.ledger.find(book.title, borrower)
+            if loan is None:
+                print(f"❌ {borrower or 'Nobody'} has no open loan of '{book.title}'!")
+                return
+            try:
+                cls._commit(cls.ledger.return_op(loan, Date.today()))
+            except OSError as e:
+                print(f"❌ Error recording return: {e}")
+                return
+            late = loan.days_overdue(loan.returned)
+            print(f"✅ Returned '{book.title}'{f' ({late} days late)' if late else ''}. "
+                  f"Total copies now: {book.copies}")
         else:
             print("❌ Book not found in our records!")
 
+    @classmethod
+    def show_loans(cls):
+        borrower = input("Borrower name (blank for all open loans): ").strip()
+        if borrower:
+            loans = list(cls.ledger.by_borrower.get(borrower.casefold(), {}).values())
+        else:
+            loans = list(cls.ledger.open.values())
+        if not loans:
+            print("📭 No open loans")
+            return
+
+        print("\n📖 Open Loans:")
+        print("-" * 60)
+        for loan in sorted(loans, key=lambda loan: loan.due):
+            print(loan)
+
+    @classmethod
+    def overdue_report(cls):
+        today = Date.today()
+        newly = cls.ledger.sweep(today)
+        if not cls.ledger.overdue:
+            print("✅ No overdue loans")
+            return
+
+        print(f"\n⏰ {len(cls.ledger.overdue)} overdue loan(s), {len(newly)} new since the last sweep:")
+        print("-" * 60)
+        for reminder in cls.ledger.reminders(today):
+            print(reminder)
+
     @classmethod
     def show_books(cls):
         if not cls.books:
@@ -81,13 +552,34 @@ class Library:
         for idx, book in enumerate(cls.books, 1):
             print(f"{idx}. {book}")
 
+    @classmethod
+    def search_books(cls):
+        mode = input("Search by (a)uthor or (t)itle prefix? [t]: ").strip().lower()
+        query = input("Search: ").strip()
+        if not query:
+            print("❌ Search cannot be empty!")
+            return
+
+        results = cls.find_by_author(query) if mode == 'a' else cls.find_by_title_prefix(query)
+        if not results:
+            print("❌ No matching books found")
+            return
+
+        print(f"\n🔍 {len(results)} matching book(s):")
+        print("-" * 60)
+        for idx, book in enumerate(results, 1):
+            print(f"{idx}. {book}")
+
 def main():
     menu = {
         '1': ('Add Book', Library.add_book),
         '2': ('Borrow Book', Library.borrow_book),
         '3': ('Return Book', Library.return_book),
         '4': ('View Catalog', Library.show_books),
-        '5': ('Exit', None)
+        '5': ('Search Books', Library.search_books),
+        '6': ('View Loans', Library.show_loans),
+        '7': ('Overdue Report', Library.overdue_report),
+        '8': ('Exit', None)
     }
 
     while True:
@@ -96,8 +588,9 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
             
-        choice = input("\nEnter choice (1-5): ")
-        if choice == '5':
+        choice = input("\nEnter choice (1-8): ")
+        if choice == '8':
+            Library.shutdown()
             print("👋 Goodbye!")
             break
         if choice in menu:
@@ -106,7 +599,8 @@ def main():
             print("❌ Invalid choice!")
 
 if __name__ == '__main__':
-    # Sample data
-    Library.books.append(Book("Python Crash Course", "Eric Matthes", 3))
-    Library.books.append(Book("Clean Code", "Robert Martin", 2))
+    if not Library.load():
+        # Sample data for a fresh library
+        Library._commit({'op': 'add', 'title': "Python Crash Course", 'author': "Eric Matthes", 'copies': 3})
+        Library._commit({'op': 'add', 'title': "Clean Code", 'author': "Robert Martin", 'copies': 2})
     main()
\ No newline at end of file
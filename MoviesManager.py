@@ -1,8 +1,20 @@
 import csv
+import gzip
 import os
-from typing import List, Dict, Optional
+import re
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 @dataclass
 class Movie:
     title: str
@@ -17,26 +29,348 @@ class Movie:
         status = "✓" if self.watched else "✗"
         return f"[{status}] {self.title} ({self.year}) - Director: {self.director}"
 
+class MovieIndex:
+    """Inverted index from title words, director names and year to store rows."""
+    FIELDS = ('title', 'director', 'year')
+    # Score per query term: (exact token match, prefix match)
+    WEIGHTS = {'title': (4, 2), 'director': (3, 1), 'year': (3, 1)}
+
+    def __init__(self, store: Optional['MovieColumns'] = None):
+        self.store = store
+        self.postings: Dict[str, Dict[str, Set[int]]] = {field: {} for field in self.FIELDS}
+        self._vocab: Dict[str, List[str]] = {field: [] for field in self.FIELDS}
+        self._stale: Set[str] = set()
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        return re.findall(r"\w+", text.lower())
+
+    def _tokens(self, row: int) -> Dict[str, Set[str]]:
+        store = self.store
+        return {
+            'title': set(self.tokenize(store.titles[row])),
+            'director': set(self.tokenize(store.directors[store.director_ids[row]])),
+            'year': {str(store.years[row])}
+        }
+
+    def rebuild(self, store: 'MovieColumns'):
+        self.__init__(store)
+        for row in store.live_rows():
+            self.add(row)
+
+    def add(self, row: int):
+        for field, tokens in self._tokens(row).items():
+            postings = self.postings[field]
+            for token in tokens:
+                if token not in postings:
+                    postings[token] = set()
+                    self._stale.add(field)
+                postings[token].add(row)
+
+    def remove(self, row: int):
+        for field, tokens in self._tokens(row).items():
+            postings = self.postings[field]
+            for token in tokens:
+                docs = postings.get(token)
+                if docs is None:
+                    continue
+                docs.discard(row)
+                if not docs:
+                    del postings[token]
+                    self._stale.add(field)
+
+    def _prefixed(self, field: str, prefix: str) -> List[str]:
+        if field in self._stale:
+            self._vocab[field] = sorted(self.postings[field])
+            self._stale.discard(field)
+        vocab = self._vocab[field]
+        tokens = []
+        for i in range(bisect_left(vocab, prefix), len(vocab)):
+            if not vocab[i].startswith(prefix):
+                break
+            tokens.append(vocab[i])
+        return tokens
+
+    def _match_term(self, term: str) -> Dict[int, int]:
+        """Best score per document for a single query term."""
+        scores: Dict[int, int] = {}
+        for field in self.FIELDS:
+            exact, prefix = self.WEIGHTS[field]
+            for token in self._prefixed(field, term):
+                weight = exact if token == term else prefix
+                for doc_id in self.postings[field][token]:
+                    if scores.get(doc_id, 0) < weight:
+                        scores[doc_id] = weight
+        return scores
+
+    def search(self, query: str) -> List[int]:
+        terms = self.tokenize(query)
+        if not terms:
+            return []
+
+        matches = sorted((self._match_term(term) for term in set(terms)), key=len)
+        candidates = set(matches[0])
+        for scores in matches[1:]:
+            candidates.intersection_update(scores)
+            if not candidates:
+                return []
+
+        phrase = " ".join(terms)
+        ranked = []
+        for doc_id in candidates:
+            score = sum(scores[doc_id] for scores in matches)
+            if " ".join(self.tokenize(self.store.titles[doc_id])) == phrase:
+                score += 10
+            ranked.append((-score, doc_id))
+        ranked.sort()
+        return [doc_id for _, doc_id in ranked]
+
+class MovieColumns:
+    """Column store holding the whole catalogue.
+
+    Titles stay a list of str; years, interned director ids and the watched
+    and live flags are typed arrays, so a movie costs its title string plus
+    about eight bytes instead of a Movie instance. Movie objects are only
+    built for rows being shown. Rows never move: a delete clears the live
+    flag, so row numbers stay valid as search-index ids, and dead rows are
+    dropped when the file is next saved and loaded.
+
+    Year-range filters run as numpy operations over zero-copy views of the
+    arrays when numpy is installed; otherwise they read only the rows of the
+    years in range. Director filters read the director's own rows, and the
+    watched statistics come from per-year counters kept up to date on every
+    change.
+    """
+
+    def __init__(self):
+        self.titles: List[str] = []
+        self.years = array('H')
+        self.director_ids = array('I')
+        self.watched = bytearray()
+        self.live = bytearray()
+        self.directors: List[str] = []
+        self._director_lookup: Dict[str, int] = {}
+        # Lowercased director name / year -> rows, in row order
+        self._director_rows: Dict[str, array] = {}
+        self._year_rows: Dict[int, array] = {}
+        # Live and watched movies per year
+        self._year_total: Dict[int, int] = {}
+        self._year_watched: Dict[int, int] = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, title: str, director: str, year: int, watched: bool = False) -> int:
+        row = len(self.titles)
+        director_id = self._director_lookup.get(director)
+        if director_id is None:
+            director_id = len(self.directors)
+            self._director_lookup[director] = director_id
+            self.directors.append(director)
+        self._director_rows.setdefault(director.lower(), array('I')).append(row)
+        self._year_rows.setdefault(year, array('I')).append(row)
+        self._year_total[year] = self._year_total.get(year, 0) + 1
+        self._year_watched[year] = self._year_watched.get(year, 0) + bool(watched)
+
+        self.titles.append(title)
+        self.years.append(year)
+        self.director_ids.append(director_id)
+        self.watched.append(watched)
+        self.live.append(1)
+        self._count += 1
+        return row
+
+    def delete(self, row: int):
+        if self.live[row]:
+            year = self.years[row]
+            self._year_total[year] -= 1
+            self._year_watched[year] -= self.watched[row]
+            self.live[row] = 0
+            self._count -= 1
+
+    def set_watched(self, row: int, watched: bool = True):
+        if self.live[row]:
+            self._year_watched[self.years[row]] += bool(watched) - self.watched[row]
+        self.watched[row] = watched
+
+    def movie(self, row: int) -> Movie:
+        return Movie(self.titles[row], self.directors[self.director_ids[row]],
+                     self.years[row], bool(self.watched[row]))
+
+    def live_rows(self) -> List[int]:
+        return list(compress(range(len(self.live)), self.live))
+
+    def keys(self) -> Iterator[Tuple[str, int]]:
+        """(lowercased title, year) of every live movie."""
+        for row in self.live_rows():
+            yield self.titles[row].lower(), self.years[row]
+
+    def filter(self, first: int, last: int, director: str = '',
+               unwatched: bool = False) -> List[int]:
+        """Live rows in a year range, optionally by one director and/or unwatched."""
+        years, live, watched = self.years, self.live, self.watched
+        if director:
+            return [row for row in self._director_rows.get(director.lower(), ())
+                    if live[row] and first <= years[row] <= last
+                    and not (unwatched and watched[row])]
+        if not self.titles:
+            return []
+        if np is not None:
+            year_view = np.frombuffer(years, dtype=np.uint16)
+            mask = (year_view >= first) & (year_view <= last)
+            mask &= np.frombuffer(live, dtype=np.bool_)
+            if unwatched:
+                mask &= ~np.frombuffer(watched, dtype=np.bool_)
+            return np.flatnonzero(mask).tolist()
+        candidates = sorted(row for year, rows in self._year_rows.items()
+                            if first <= year <= last for row in rows)
+        if unwatched:
+            return [row for row in candidates if live[row] and not watched[row]]
+        return [row for row in candidates if live[row]]
+
+    def watched_count(self) -> int:
+        return sum(self._year_watched.values())
+
+    def watched_by_decade(self) -> Dict[int, float]:
+        totals: Dict[int, int] = {}
+        seen: Dict[int, int] = {}
+        for year, total in self._year_total.items():
+            decade = year - year % 10
+            totals[decade] = totals.get(decade, 0) + total
+            seen[decade] = seen.get(decade, 0) + self._year_watched[year]
+        return {decade: 100 * seen[decade] / total
+                for decade, total in sorted(totals.items()) if total}
+
+class MovieImporter:
+    """Streams large CSV/TSV movie dumps (optionally gzipped) into Movie rows.
+
+    Lines are read in chunks and parsed on a process pool; results come back
+    in file order so the first occurrence of a (title, year) pair wins.
+    """
+    CHUNK_SIZE = 50_000
+    COLUMN_ALIASES = {
+        'title': ('title', 'primarytitle', 'name', 'movie'),
+        'director': ('director', 'directors', 'director_name'),
+        'year': ('year', 'startyear', 'release_year'),
+        'watched': ('watched', 'seen')
+    }
+    NULLS = ('', '\\N', 'NULL', 'null')
+
+    def __init__(self, path: str, columns: Optional[Dict[str, str]] = None,
+                 workers: Optional[int] = None):
+        self.path = path
+        self.columns = columns or {}
+        self.workers = workers or os.cpu_count() or 1
+        self.rejected = 0
+        self.duplicates = 0
+
+    def _open(self):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, 'rt', encoding='utf-8', newline='')
+        return open(self.path, 'r', encoding='utf-8', newline='')
+
+    def _layout(self, header: str) -> Tuple[str, Dict[str, int]]:
+        delimiter = '\t' if '\t' in header else ','
+        names = [name.strip().lower() for name in next(csv.reader([header], delimiter=delimiter))]
+        positions = {}
+        for field, aliases in self.COLUMN_ALIASES.items():
+            wanted = [self.columns[field].lower()] if field in self.columns else aliases
+            for alias in wanted:
+                if alias in names:
+                    positions[field] = names.index(alias)
+                    break
+
+        missing = {'title', 'director', 'year'} - positions.keys()
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+        return delimiter, positions
+
+    def _chunks(self, file) -> Iterator[List[str]]:
+        chunk = []
+        for line in file:
+            chunk.append(line)
+            if len(chunk) >= self.CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _parse_chunk(lines: List[str], delimiter: str, positions: Dict[str, int]):
+        quoting = csv.QUOTE_NONE if delimiter == '\t' else csv.QUOTE_MINIMAL
+        rows, rejected = [], 0
+        watched_at = positions.get('watched')
+        for fields in csv.reader(lines, delimiter=delimiter, quoting=quoting):
+            try:
+                title = fields[positions['title']].strip()
+                director = fields[positions['director']].strip()
+                year = int(fields[positions['year']])
+            except (IndexError, ValueError):
+                rejected += 1
+                continue
+            if (title in MovieImporter.NULLS or director in MovieImporter.NULLS
+                    or year <= 1800 or year > 2100):
+                rejected += 1
+                continue
+            watched = (watched_at is not None and watched_at < len(fields)
+                       and fields[watched_at].strip().lower() in ('true', '1', 'yes'))
+            rows.append((title, director, year, watched))
+        return rows, rejected
+
+    def run(self, existing: MovieColumns) -> List[Tuple[str, str, int, bool]]:
+        """Return (title, director, year, watched) for the dump's movies not already in `existing`."""
+        seen = set(existing.keys())
+        imported = []
+
+        def collect(result):
+            rows, rejected = result
+            self.rejected += rejected
+            for title, director, year, watched in rows:
+                key = (title.lower(), year)
+                if key in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(key)
+                imported.append((title, director, year, watched))
+
+        with self._open() as file:
+            delimiter, positions = self._layout(file.readline())
+            chunks = self._chunks(file)
+            if self.workers <= 1:
+                for chunk in chunks:
+                    collect(self._parse_chunk(chunk, delimiter, positions))
+                return imported
+
+            with ProcessPoolExecutor(self.workers) as pool:
+                # Bound the chunks in flight so huge dumps don't sit in memory
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(self._parse_chunk, chunk, delimiter, positions))
+                    if len(pending) >= self.workers * 2:
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+        return imported
+
 class MovieManager:
     FILE = 'movies.csv'
-    movies: List[Movie] = []
+    movies = MovieColumns()
+    index = MovieIndex(movies)
 
     @classmethod
     def load_movies(cls):
         if os.path.exists(cls.FILE):
             try:
+                movies = MovieColumns()
                 with open(cls.FILE, 'r', newline='') as file:
                     reader = csv.DictReader(file)
-                    cls.movies = [
-                        Movie(
-                            row['title'],
-                            row['director'],
-                            int(row['year']),
-                            row['watched'].upper() == 'TRUE'
-                        )
-                        for row in reader
-                        if row['title'] and row['director'] and row['year']
-                    ]
+                    for row in reader:
+                        if row['title'] and row['director'] and row['year']:
+                            movies.append(row['title'], row['director'], int(row['year']),
+                                          row['watched'].upper() == 'TRUE')
+                cls.movies = movies
+                cls.index.rebuild(movies)
             except Exception as e:
                 print(f"❌ Error loading movies: {e}")
 
@@ -46,7 +380,8 @@ class MovieManager:
             with open(cls.FILE, 'w', newline='') as file:
                 writer = csv.DictWriter(file, fieldnames=['title', 'director', 'year', 'watched'])
                 writer.writeheader()
-                for movie in cls.movies:
+                for row in cls.movies.live_rows():
+                    movie = cls.movies.movie(row)
                     writer.writerow({
                         'title': movie.title,
                         'director': movie.director,
@@ -71,23 +406,25 @@ class MovieManager:
             if year <= 1800 or year > 2100:
                 raise ValueError("Invalid year")
                 
-            cls.movies.append(Movie(title, director, year))
+            cls.index.add(cls.movies.append(title, director, year))
             cls.save_movies()
             print("✅ Movie added successfully!")
         except ValueError as e:
             print(f"❌ Error: {e}")
 
     @classmethod
-    def show_movies(cls, movies: List[Movie] = None):
-        movies_to_show = movies or cls.movies
-        if not movies_to_show:
+    def show_movies(cls, rows: List[int] = None) -> List[int]:
+        """Print the given rows (all movies by default); returns the rows as numbered."""
+        rows = rows or cls.movies.live_rows()
+        if not rows:
             print("🎬 No movies in collection")
-            return
+            return rows
             
         print("\n🎬 Movie Collection:")
         print("=" * 60)
-        for idx, movie in enumerate(movies_to_show, 1):
-            print(f"{idx}. {movie}")
+        for idx, row in enumerate(rows, 1):
+            print(f"{idx}. {cls.movies.movie(row)}")
+        return rows
 
     @classmethod
     def search_movies(cls):
@@ -96,25 +433,23 @@ class MovieManager:
             print("❌ Please enter a search term")
             return
             
-        results = [
-            movie for movie in cls.movies
-            if (query in movie.title.lower() or
-                query in movie.director.lower() or
-                query in str(movie.year))
-        ]
-        
+        results = cls.index.search(query)
+        if not results:
+            print("🎬 No matching movies found")
+            return
+
         cls.show_movies(results)
 
     @classmethod
     def mark_watched(cls):
-        cls.show_movies()
-        if not cls.movies:
+        rows = cls.show_movies()
+        if not rows:
             return
             
         try:
             choice = int(input("Select movie number to mark as watched: ")) - 1
-            if 0 <= choice < len(cls.movies):
-                cls.movies[choice].mark_watched()
+            if 0 <= choice < len(rows):
+                cls.movies.set_watched(rows[choice])
                 cls.save_movies()
                 print("✅ Movie marked as watched!")
             else:
@@ -124,21 +459,77 @@ class MovieManager:
 
     @classmethod
     def delete_movie(cls):
-        cls.show_movies()
-        if not cls.movies:
+        rows = cls.show_movies()
+        if not rows:
             return
             
         try:
             choice = int(input("Select movie number to delete: ")) - 1
-            if 0 <= choice < len(cls.movies):
-                deleted = cls.movies.pop(choice)
+            if 0 <= choice < len(rows):
+                row = rows[choice]
+                cls.index.remove(row)
+                cls.movies.delete(row)
                 cls.save_movies()
-                print(f"✅ Deleted: {deleted.title}")
+                print(f"✅ Deleted: {cls.movies.titles[row]}")
             else:
                 print("❌ Invalid selection!")
         except ValueError:
             print("❌ Please enter a valid number!")
 
+    @classmethod
+    def import_movies(cls):
+        path = input("Dump file (.csv/.tsv, optionally .gz): ").strip()
+        if not os.path.exists(path):
+            print("❌ File not found!")
+            return
+
+        importer = MovieImporter(path)
+        try:
+            imported = importer.run(cls.movies)
+        except (ValueError, OSError, csv.Error) as e:
+            print(f"❌ Error importing movies: {e}")
+            return
+
+        for title, director, year, watched in imported:
+            cls.index.add(cls.movies.append(title, director, year, watched))
+        cls.save_movies()
+        print(f"✅ Imported {len(imported)} movies "
+              f"({importer.duplicates} duplicates, {importer.rejected} rejected)")
+
+    @classmethod
+    def filter_movies(cls):
+        try:
+            first = int(input("From year (blank for any): ").strip() or 0)
+            last = int(input("To year (blank for any): ").strip() or 9999)
+        except ValueError:
+            print("❌ Please enter a valid year!")
+            return
+
+        director = input("Director (blank for any): ").strip()
+        unwatched = input("Only unwatched? (y/n): ").strip().lower() == 'y'
+        results = cls.movies.filter(first, last, director, unwatched)
+        if not results:
+            print("🎬 No matching movies found")
+            return
+
+        cls.show_movies(results)
+
+    @classmethod
+    def show_stats(cls):
+        movies = cls.movies
+        if not len(movies):
+            print("🎬 No movies in collection")
+            return
+
+        watched = movies.watched_count()
+        print("\n📊 Collection Statistics:")
+        print("=" * 40)
+        print(f"Movies: {len(movies)} | Directors: {len(movies.directors)}")
+        print(f"Watched: {watched} ({100 * watched / len(movies):.1f}%)")
+        print("-" * 40)
+        for decade, percent in movies.watched_by_decade().items():
+            print(f"{decade}s: {percent:.1f}% watched")
+
 def main():
     MovieManager.load_movies()
     
@@ -148,7 +539,10 @@ def main():
         '3': ('Search Movies', MovieManager.search_movies),
         '4': ('Mark as Watched', MovieManager.mark_watched),
         '5': ('Delete Movie', MovieManager.delete_movie),
-        '6': ('Exit', None)
+        '6': ('Filter Movies', MovieManager.filter_movies),
+        '7': ('Statistics', MovieManager.show_stats),
+        '8': ('Import Movies', MovieManager.import_movies),
+        '9': ('Exit', None)
     }
 
     while True:
@@ -157,8 +551,8 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
             
-        choice = input("\nEnter choice (1-6): ")
-        if choice == '6':
+        choice = input("\nEnter choice (1-9): ")
+        if choice == '9':
             MovieManager.save_movies()
             print("👋 Goodbye!")
             break
@@ -1,48 +1,329 @@
 import csv
+import heapq
+import json
 import os
-from typing import List, Dict
-from dataclasses import dataclass
+import random
+import tempfile
+import threading
+import time
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 
 @dataclass
 class Customer:
     name: str
     renewal: str = "Not yet"
     done: bool = False
+    priority: str = "walk-in"
+    lane: str = "general"
+    ticket: int = -1
+
+class LaneScheduler:
+    """Per-lane heaps ordered by priority class with aging.
+
+    A customer's key is rank * AGING_STEP + ticket, so each AGING_STEP later
+    arrivals lift a waiting customer by one class: a walk-in is never starved
+    by a steady stream of VIPs. With a single class this is plain FIFO.
+    """
+    PRIORITIES = {'appointment': 0, 'vip': 1, 'walk-in': 2}
+    AGING_STEP = 20
+
+    def __init__(self):
+        self.lanes: Dict[str, List[Tuple[int, int, Customer]]] = {}
+        self.next_ticket = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[Customer]:
+        """Waiting customers across all lanes in service order."""
+        entries = [entry for heap in self.lanes.values() for entry in heap]
+        return (customer for _, _, customer in sorted(entries))
+
+    def push(self, customer: Customer):
+        if customer.priority not in self.PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(self.PRIORITIES)}")
+        if customer.ticket < 0:
+            customer.ticket = self.next_ticket
+        self.next_ticket = max(self.next_ticket, customer.ticket + 1)
+        key = self.PRIORITIES[customer.priority] * self.AGING_STEP + customer.ticket
+        heapq.heappush(self.lanes.setdefault(customer.lane, []), (key, customer.ticket, customer))
+        self._size += 1
+
+    def _best_lane(self, lanes: Optional[List[str]]) -> Optional[str]:
+        best = None
+        for lane in (self.lanes if lanes is None else lanes):
+            heap = self.lanes.get(lane)
+            if heap and (best is None or heap[0] < self.lanes[best][0]):
+                best = lane
+        return best
+
+    def peek(self, lanes: Optional[List[str]] = None) -> Optional[Customer]:
+        lane = self._best_lane(lanes)
+        return self.lanes[lane][0][2] if lane else None
+
+    def pop(self, lanes: Optional[List[str]] = None) -> Optional[Customer]:
+        lane = self._best_lane(lanes)
+        if lane is None:
+            return None
+        self._size -= 1
+        return heapq.heappop(self.lanes[lane])[2]
+
+class WriteAheadLog:
+    """Append-only JSON-lines journal of queue events.
+
+    Each event is one appended line, so logging costs the same no matter how
+    long the queue is. With fsync='always' every event is forced to disk;
+    with fsync='batch' only every `batch` events are, trading the last few
+    events on power loss for throughput.
+    """
+
+    def __init__(self, path: str, fsync: str = 'always', batch: int = 64):
+        if fsync not in ('always', 'batch'):
+            raise ValueError("fsync must be 'always' or 'batch'")
+        self.path = path
+        self.fsync = fsync
+        self.batch = batch
+        self.events = 0
+        self._unsynced = 0
+        self._file = None
+
+    def append(self, event: dict):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(event) + '\n')
+        self._file.flush()
+        self.events += 1
+        self._unsynced += 1
+        if self.fsync == 'always' or self._unsynced >= self.batch:
+            self.sync()
+
+    def sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def replay(self) -> Iterator[dict]:
+        """Yield logged events, then cut off a torn final write from a crash.
+
+        Without the cut, the next append would be glued onto the broken
+        line and every event after it would be unreadable on the next load.
+        """
+        if not os.path.exists(self.path):
+            return
+        good = 0
+        with open(self.path, 'rb') as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+                yield event
+        if os.path.getsize(self.path) > good:
+            self.close()
+            with open(self.path, 'r+b') as file:
+                file.truncate(good)
+                os.fsync(file.fileno())
+
+    def reset(self):
+        self.close()
+        with open(self.path, 'w', encoding='utf-8') as file:
+            os.fsync(file.fileno())
+        self.events = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
 
 class QueueManager:
     FILE = 'queue.csv'
-    customers: List[Customer] = []
+    WAL_FILE = 'queue.wal'
+    FSYNC_POLICY = 'always'
+    # Fold the journal into a fresh queue.csv snapshot after this many events
+    COMPACT_EVERY = 1000
+    FIELDS = ['name', 'renewal', 'done', 'priority', 'lane', 'ticket']
+    scheduler = LaneScheduler()
+    completed: List[Customer] = []
+    # Claimed by an agent but not finished yet, keyed by ticket
+    in_service: Dict[int, Customer] = {}
+    # Lowercased name -> most recent customer with that name
+    index: Dict[str, Customer] = {}
+
+    _lock = threading.RLock()
+    _available = threading.Condition(_lock)
+    _wal: Optional[WriteAheadLog] = None
+
+    @classmethod
+    def _journal(cls) -> WriteAheadLog:
+        if cls._wal is None or cls._wal.path != cls.WAL_FILE:
+            cls._wal = WriteAheadLog(cls.WAL_FILE, cls.FSYNC_POLICY)
+        return cls._wal
+
+    @classmethod
+    def _log(cls, event: dict):
+        if cls.WAL_FILE is None:
+            return
+        with cls._lock:
+            wal = cls._journal()
+            wal.append(event)
+            if wal.events >= cls.COMPACT_EVERY:
+                cls.save_queue()
+
+    @classmethod
+    def _track(cls, customer: Customer):
+        with cls._lock:
+            if customer.done:
+                cls.completed.append(customer)
+                # Tickets stay unique across finished customers too
+                cls.scheduler.next_ticket = max(cls.scheduler.next_ticket, customer.ticket + 1)
+            else:
+                cls.scheduler.push(customer)
+                cls._available.notify()
+            cls.index[customer.name.lower()] = customer
+
+    @classmethod
+    def enqueue(cls, name: str, priority: str = "walk-in", lane: str = "general") -> Customer:
+        customer = Customer(name, priority=priority, lane=lane)
+        with cls._lock:
+            cls._track(customer)
+            cls._log({'op': 'enqueue', 'name': name, 'priority': priority,
+                      'lane': lane, 'ticket': customer.ticket})
+        return customer
+
+    @classmethod
+    def peek(cls, lanes: Optional[List[str]] = None) -> Optional[Customer]:
+        with cls._lock:
+            return cls.scheduler.peek(lanes)
+
+    @classmethod
+    def dequeue(cls, lanes: Optional[List[str]] = None) -> Optional[Customer]:
+        """Next customer for a desk serving `lanes` (all lanes if None).
+
+        Like claim(), the customer is held in `in_service` until complete()
+        or release(), so a snapshot taken meanwhile still saves them.
+        """
+        with cls._lock:
+            customer = cls.scheduler.pop(lanes)
+            if customer is not None:
+                cls.in_service[customer.ticket] = customer
+            return customer
+
+    @classmethod
+    def complete(cls, customer: Customer, renewal: str):
+        with cls._lock:
+            cls.in_service.pop(customer.ticket, None)
+            customer.renewal = renewal
+            customer.done = True
+            cls.completed.append(customer)
+            cls._log({'op': 'complete', 'ticket': customer.ticket, 'renewal': renewal})
+
+    @classmethod
+    def claim(cls, lanes: Optional[List[str]] = None,
+              timeout: Optional[float] = None) -> Optional[Customer]:
+        """Atomically take the next customer for an agent, waiting up to `timeout`."""
+        with cls._available:
+            if not cls._available.wait_for(lambda: cls.scheduler.peek(lanes) is not None, timeout):
+                return None
+            return cls.dequeue(lanes)
+
+    @classmethod
+    def release(cls, customer: Customer):
+        """Put a claimed or skipped customer back in their original place."""
+        with cls._lock:
+            cls.in_service.pop(customer.ticket, None)
+            cls.scheduler.push(customer)
+            cls._available.notify()
+
+    @classmethod
+    def finish(cls, customer: Customer, renewal: str):
+        cls.complete(customer, renewal)
 
     @classmethod
     def load_queue(cls):
+        """Load the queue.csv snapshot, then replay the journal on top of it."""
+        customers: List[Customer] = []
         if os.path.exists(cls.FILE):
             try:
                 with open(cls.FILE, 'r', newline='') as file:
                     reader = csv.DictReader(file)
-                    cls.customers = [
+                    customers = [
                         Customer(
                             row['name'],
                             row['renewal'],
-                            row['done'].lower() == 'true'
+                            row['done'].lower() == 'true',
+                            row.get('priority') or "walk-in",
+                            row.get('lane') or "general",
+                            int(row.get('ticket') or -1)
                         )
                         for row in reader
                         if row['name']
                     ]
             except Exception as e:
                 print(f"❌ Error loading queue: {e}")
+                return
+
+        # Number ticketless rows from older files the same way on every load
+        next_ticket = 0
+        waiting: Dict[int, Customer] = {}
+        for customer in customers:
+            if customer.ticket < 0 and not customer.done:
+                customer.ticket = next_ticket
+            next_ticket = max(next_ticket, customer.ticket + 1)
+            if not customer.done:
+                waiting[customer.ticket] = customer
+        known = {customer.ticket for customer in customers}
+
+        # Events already folded into the snapshot (a crash between writing
+        # it and truncating the journal) are recognised by ticket and skipped
+        for event in cls._journal().replay():
+            if event['op'] == 'enqueue' and event['ticket'] not in known:
+                customer = Customer(event['name'], priority=event['priority'],
+                                    lane=event['lane'], ticket=event['ticket'])
+                customers.append(customer)
+                waiting[customer.ticket] = customer
+                known.add(customer.ticket)
+            elif event['op'] == 'complete' and event['ticket'] in waiting:
+                customer = waiting.pop(event['ticket'])
+                customer.renewal = event['renewal']
+                customer.done = True
+
+        with cls._lock:
+            cls.scheduler, cls.completed, cls.index = LaneScheduler(), [], {}
+            cls.in_service = {}
+            for customer in customers:
+                cls._track(customer)
 
     @classmethod
     def save_queue(cls):
+        """Write a full snapshot atomically and truncate the journal."""
         try:
-            with open(cls.FILE, 'w', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=['name', 'renewal', 'done'])
-                writer.writeheader()
-                for customer in cls.customers:
-                    writer.writerow({
-                        'name': customer.name,
-                        'renewal': customer.renewal,
-                        'done': str(customer.done)
-                    })
+            with cls._lock:
+                directory = os.path.dirname(os.path.abspath(cls.FILE))
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                with os.fdopen(fd, 'w', newline='') as file:
+                    writer = csv.DictWriter(file, fieldnames=cls.FIELDS)
+                    writer.writeheader()
+                    # Customers still being served are saved as waiting
+                    for customer in [*cls.completed, *cls.in_service.values(), *cls.scheduler]:
+                        writer.writerow({
+                            'name': customer.name,
+                            'renewal': customer.renewal,
+                            'done': str(customer.done),
+                            'priority': customer.priority,
+                            'lane': customer.lane,
+                            'ticket': customer.ticket
+                        })
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, cls.FILE)
+                if cls.WAL_FILE is not None:
+                    cls._journal().reset()
         except Exception as e:
             print(f"❌ Error saving queue: {e}")
 
@@ -52,60 +333,334 @@ class QueueManager:
         if not name:
             print("❌ Name cannot be empty!")
             return
-            
-        cls.customers.append(Customer(name))
-        cls.save_queue()
+
+        priority = input(f"Priority ({'/'.join(LaneScheduler.PRIORITIES)}) [walk-in]: ").strip().lower()
+        lane = input("Lane [general]: ").strip().lower()
+        try:
+            cls.enqueue(name, priority or "walk-in", lane or "general")
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
         print(f"✅ Added {name} to the queue")
 
     @classmethod
     def show_queue(cls):
-        if not cls.customers:
+        if not len(cls.scheduler) and not cls.completed:
             print("📭 Queue is empty")
             return
             
         print("\n📋 Current Queue:")
         print("=" * 60)
-        for idx, customer in enumerate(cls.customers, 1):
+        for idx, customer in enumerate([*cls.completed, *cls.scheduler], 1):
             status = "✓" if customer.done else "✗"
-            print(f"{idx}. {customer.name} | Renewal: {customer.renewal} | Status: {status}")
+            print(f"{idx}. {customer.name} | {customer.priority} @ {customer.lane} | "
+                  f"Renewal: {customer.renewal} | Status: {status}")
 
     @classmethod
     def process_queue(cls):
-        if not cls.customers:
+        if not len(cls.scheduler):
             print("📭 Queue is empty")
             return
-            
+
+        lanes = input("Lanes to serve (comma separated, Enter for all): ").strip().lower()
+        lanes = [lane.strip() for lane in lanes.split(',')] if lanes else None
+
         print("\n🔄 Processing Queue:")
-        for customer in cls.customers[:]:
-            if not customer.done:
-                print(f"\nCurrent customer: {customer.name}")
-                action = input("Enter 's' to skip, 'd' to mark done, or 'x' to exit: ").lower()
-                
-                if action == 'x':
-                    break
-                elif action == 'd':
-                    customer.renewal = input("Enter renewal details: ").strip()
-                    customer.done = True
-                    print(f"✅ Completed: {customer.name}")
-                elif action == 's':
-                    print(f"⏭ Skipped: {customer.name}")
-                    continue
-                    
-        cls.save_queue()
+        # Claimed rather than dequeued: skipped and current customers stay in
+        # in_service, so a compaction mid-loop still writes them to the snapshot
+        skipped = []
+        while True:
+            customer = cls.claim(lanes, 0)
+            if customer is None:
+                break
+            print(f"\nCurrent customer: {customer.name} ({customer.priority}, {customer.lane})")
+            action = input("Enter 's' to skip, 'd' to mark done, or 'x' to exit: ").lower()
+
+            if action == 'x':
+                skipped.append(customer)
+                break
+            elif action == 'd':
+                cls.finish(customer, input("Enter renewal details: ").strip())
+                print(f"✅ Completed: {customer.name}")
+            elif action == 's':
+                skipped.append(customer)
+                cls._log({'op': 'skip', 'ticket': customer.ticket})
+                print(f"⏭ Skipped: {customer.name}")
+            else:
+                # Unknown input leaves the customer in place, like a skip
+                skipped.append(customer)
+
+        # Tickets are kept, so skipped customers return to their old place
+        for customer in skipped:
+            cls.release(customer)
         print("\nQueue processing complete")
 
     @classmethod
     def customer_inquiry(cls):
         name = input("Search customer name: ").strip()
-        for customer in cls.customers:
-            if customer.name.lower() == name.lower():
-                print(f"\n🔍 Customer Found:")
-                print(f"Name: {customer.name}")
-                print(f"Renewal: {customer.renewal}")
-                print(f"Status: {'Done' if customer.done else 'Pending'}")
-                return
+        customer = cls.index.get(name.lower())
+        if customer:
+            print(f"\n🔍 Customer Found:")
+            print(f"Name: {customer.name}")
+            print(f"Renewal: {customer.renewal}")
+            print(f"Status: {'Done' if customer.done else 'Pending'}")
+            return
         print("❌ Customer not found")
 
+    @classmethod
+    def run_agents(cls):
+        try:
+            count = int(input("Number of agents: ").strip())
+            if count < 1:
+                raise ValueError
+        except ValueError:
+            print("❌ Please enter a positive number!")
+            return
+
+        agents = ServiceAgents(lambda customer, agent: f"Served by {agent}", count)
+        agents.start()
+        agents.join()
+        for agent, served in sorted(agents.served.items()):
+            print(f"👤 {agent}: served {served}")
+        print(f"✅ {sum(agents.served.values())} customers served")
+        for customer in agents.gave_up:
+            print(f"⚠️ {customer.name} failed {ServiceAgents.MAX_ATTEMPTS} times and was put back in the queue")
+
+    @classmethod
+    def run_simulation(cls):
+        try:
+            desks = int(input("Desks: ").strip())
+            rate = float(input("Arrivals per minute: ").strip())
+            service = float(input("Mean service time (minutes): ").strip())
+            customers = int(input("Customers to simulate: ").strip())
+            pattern = input("Arrival pattern (poisson/bursty) [poisson]: ").strip().lower() or 'poisson'
+            simulator = QueueSimulator(desks, rate, service, pattern)
+        except ValueError as e:
+            print(f"❌ Invalid input: {e}")
+            return
+
+        print(simulator.run(customers))
+
+@dataclass
+class SimulationReport:
+    customers: int
+    events: int
+    sim_minutes: float
+    wall_seconds: float
+    waits: List[float] = field(repr=False)
+    lengths: Dict[int, float] = field(repr=False)
+
+    @property
+    def throughput(self) -> float:
+        return self.customers / self.sim_minutes if self.sim_minutes else 0.0
+
+    def wait_percentile(self, pct: float) -> float:
+        if not self.waits:
+            return 0.0
+        return self.waits[min(len(self.waits) - 1, int(pct / 100 * len(self.waits)))]
+
+    def length_percentile(self, pct: float) -> int:
+        """Queue length not exceeded for pct% of simulated time."""
+        total = sum(self.lengths.values())
+        running = 0.0
+        for length in sorted(self.lengths):
+            running += self.lengths[length]
+            if running >= pct / 100 * total:
+                return length
+        return 0
+
+    def __str__(self):
+        total = sum(self.lengths.values()) or 1
+        mean_length = sum(length * spent for length, spent in self.lengths.items()) / total
+        return "\n".join([
+            "\n📊 Simulation Report:",
+            "=" * 40,
+            f"Customers served: {self.customers} in {self.sim_minutes:.1f} simulated minutes",
+            f"Throughput: {self.throughput:.2f} customers/minute",
+            f"Wait p50/p90/p99: {self.wait_percentile(50):.2f} / "
+            f"{self.wait_percentile(90):.2f} / {self.wait_percentile(99):.2f} minutes",
+            f"Queue length mean: {mean_length:.2f} | p50/p90/p99: {self.length_percentile(50)} / "
+            f"{self.length_percentile(90)} / {self.length_percentile(99)}",
+            f"Benchmark: {self.events} events in {self.wall_seconds:.2f}s "
+            f"({self.events / max(self.wall_seconds, 1e-9):,.0f} events/s)",
+        ])
+
+class QueueSimulator:
+    """Discrete-event simulation of service desks draining QueueManager.
+
+    Arrivals are Poisson, or "bursty": a two-state process in which
+    `burst_share` of arrivals come in bursts `burst_factor` times faster. Service
+    times are exponential. Customers go through the real enqueue/dequeue/
+    complete path with journaling switched off, so the same run also works
+    as a throughput benchmark for the queue data structures.
+    """
+    PATTERNS = ('poisson', 'bursty')
+    PRIORITY_WEIGHTS = {'appointment': 0.1, 'vip': 0.1, 'walk-in': 0.8}
+    # Completed customers are dropped from memory every this many departures
+    TRIM_EVERY = 100_000
+
+    def __init__(self, desks: int = 4, arrival_rate: float = 1.0, service_time: float = 3.0,
+                 pattern: str = 'poisson', burst_factor: float = 5.0, burst_share: float = 0.2,
+                 seed: Optional[int] = None):
+        if pattern not in self.PATTERNS:
+            raise ValueError(f"pattern must be one of: {', '.join(self.PATTERNS)}")
+        if desks < 1 or arrival_rate <= 0 or service_time <= 0:
+            raise ValueError("desks, arrival rate and service time must be positive")
+        self.desks = desks
+        self.arrival_rate = arrival_rate
+        self.service_time = service_time
+        self.pattern = pattern
+        self.burst_factor = burst_factor
+        self.burst_share = burst_share
+        self.random = random.Random(seed)
+
+    def _interarrivals(self) -> Iterator[float]:
+        rng = self.random
+        if self.pattern == 'poisson':
+            while True:
+                yield rng.expovariate(self.arrival_rate)
+
+        # Keep the long-run mean rate equal to arrival_rate
+        calm = self.arrival_rate * (1 - self.burst_share + self.burst_share / self.burst_factor)
+        bursting = False
+        while True:
+            rate = calm * self.burst_factor if bursting else calm
+            yield rng.expovariate(rate)
+            if rng.random() < 0.01:
+                bursting = rng.random() < self.burst_share
+
+    def run(self, customers: int) -> SimulationReport:
+        rng = self.random
+        priorities = list(self.PRIORITY_WEIGHTS)
+        weights = list(self.PRIORITY_WEIGHTS.values())
+        saved = (QueueManager.scheduler, QueueManager.completed, QueueManager.index,
+                 QueueManager.in_service, QueueManager.WAL_FILE)
+        QueueManager.scheduler, QueueManager.completed = LaneScheduler(), []
+        QueueManager.index, QueueManager.in_service = {}, {}
+        QueueManager.WAL_FILE = None
+
+        events: List[Tuple[float, int, Optional[Customer]]] = []
+        arrived_at: Dict[int, float] = {}
+        waits: List[float] = []
+        lengths: Dict[int, float] = {}
+        free_desks = self.desks
+        now = last = 0.0
+        seq = arrivals = served = processed = 0
+        interarrivals = self._interarrivals()
+        started = time.perf_counter()
+        try:
+            # None marks an arrival; a customer marks that customer's departure
+            heapq.heappush(events, (next(interarrivals), seq, None))
+            while events:
+                now, _, customer = heapq.heappop(events)
+                processed += 1
+                queued = len(QueueManager.scheduler)
+                lengths[queued] = lengths.get(queued, 0.0) + now - last
+                last = now
+
+                if customer is None:
+                    arrivals += 1
+                    customer = QueueManager.enqueue(
+                        f"sim-{arrivals}", rng.choices(priorities, weights)[0])
+                    arrived_at[customer.ticket] = now
+                    if arrivals < customers:
+                        seq += 1
+                        heapq.heappush(events, (now + next(interarrivals), seq, None))
+                else:
+                    QueueManager.complete(customer, "Simulated")
+                    served += 1
+                    free_desks += 1
+                    if served % self.TRIM_EVERY == 0:
+                        QueueManager.completed.clear()
+                        QueueManager.index.clear()
+
+                while free_desks and len(QueueManager.scheduler):
+                    next_customer = QueueManager.dequeue()
+                    waits.append(now - arrived_at.pop(next_customer.ticket))
+                    free_desks -= 1
+                    seq += 1
+                    heapq.heappush(events, (now + rng.expovariate(1 / self.service_time),
+                                            seq, next_customer))
+        finally:
+            (QueueManager.scheduler, QueueManager.completed, QueueManager.index,
+             QueueManager.in_service, QueueManager.WAL_FILE) = saved
+
+        waits.sort()
+        return SimulationReport(served, processed, now, time.perf_counter() - started,
+                                waits, lengths)
+
+class ServiceAgents:
+    """Pool of agent threads serving customers from QueueManager concurrently.
+
+    `handler(customer, agent)` returns the renewal details. Claims are atomic,
+    so no customer is served twice; if the handler raises, the customer is
+    released back to the queue. After MAX_ATTEMPTS failures a customer is
+    set aside in `failed` (still claimed, so snapshots keep them) and only
+    released back to the queue when the agents finish. With drain=True
+    agents stop once the lanes are empty, otherwise they keep waiting for
+    new arrivals until stop().
+    """
+    POLL_INTERVAL = 0.5
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, handler: Callable[[Customer, str], str], agents: int = 4,
+                 lanes: Optional[List[str]] = None, drain: bool = True):
+        self.handler = handler
+        self.lanes = lanes
+        self.drain = drain
+        self.served: Dict[str, int] = {f"agent-{i}": 0 for i in range(1, agents + 1)}
+        self.failures = 0
+        self.failed: List[Customer] = []
+        # Customers set aside during the last run, returned to the queue by join()
+        self.gave_up: List[Customer] = []
+        self._attempts: Dict[int, int] = {}
+        self._failures_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._run, args=(name,), name=name, daemon=True)
+            for name in self.served
+        ]
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.join()
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+        with self._failures_lock:
+            failed, self.failed = self.failed, []
+        for customer in failed:
+            QueueManager.release(customer)
+        self.gave_up = failed
+
+    def _run(self, agent: str):
+        timeout = 0 if self.drain else self.POLL_INTERVAL
+        while not self._stop.is_set():
+            customer = QueueManager.claim(self.lanes, timeout)
+            if customer is None:
+                if self.drain:
+                    return
+                continue
+            try:
+                renewal = self.handler(customer, agent)
+            except Exception:
+                with self._failures_lock:
+                    self.failures += 1
+                    attempts = self._attempts.get(customer.ticket, 0) + 1
+                    self._attempts[customer.ticket] = attempts
+                    if attempts >= self.MAX_ATTEMPTS:
+                        self.failed.append(customer)
+                        continue
+                QueueManager.release(customer)
+                continue
+            QueueManager.finish(customer, renewal)
+            self.served[agent] += 1
+
 def main():
     QueueManager.load_queue()
     
@@ -114,7 +669,9 @@ def main():
         '2': ('View Queue', QueueManager.show_queue),
         '3': ('Process Queue', QueueManager.process_queue),
         '4': ('Customer Inquiry', QueueManager.customer_inquiry),
-        '5': ('Exit', None)
+        '5': ('Run Service Agents', QueueManager.run_agents),
+        '6': ('Run Simulation', QueueManager.run_simulation),
+        '7': ('Exit', None)
     }
 
     while True:
@@ -123,8 +680,8 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
             
-        choice = input("\nEnter choice (1-5): ")
-        if choice == '5':
+        choice = input("\nEnter choice (1-7): ")
+        if choice == '7':
             QueueManager.save_queue()
             print("👋 Goodbye!")
             break
@@ -1,16 +1,258 @@
-from typing import List, Dict
+import heapq
+import random
+import threading
+import time
+from bisect import bisect_right, insort
+from collections import deque
+from itertools import count, islice
+from typing import List, Dict, Optional, Tuple
 
 class Product:
-    def __init__(self, name: str, price: float, stock: int):
+    def __init__(self, product_id: int, name: str, price: float, stock: int, reorder_point: int = 0):
+        self.product_id = product_id
         self.name = name
         self.price = price
         self.stock = stock
+        self.reorder_point = reorder_point
+        # Units held by unexpired cart reservations
+        self.reserved = 0
+
+    @property
+    def available(self) -> int:
+        return self.stock - self.reserved
 
     def __str__(self):
-        return f"{self.name} - ${self.price:.2f} (Stock: {self.stock})"
+        return f"#{self.product_id} {self.name} - ${self.price:.2f} (Stock: {self.available})"
+
+class Reservation:
+    def __init__(self, product: Product, quantity: int, expires: float):
+        self.product = product
+        self.quantity = quantity
+        self.expires = expires
+
+class StockIndex:
+    """Products bucketed by stock level, for low-stock queries.
+
+    Each distinct level maps to the set of products at it, and the levels
+    are kept sorted, so a stock change is two set operations and "below N"
+    or "N lowest" walk only the buckets they return. When a product's stock
+    drops to or below its reorder point an alert is queued; it is re-armed
+    once the product is restocked above that point.
+
+    Stock changes happen under the inventory's stripe locks, so `moved`
+    only queues the product there; the buckets are brought up to date under
+    the index's own lock after the stripes are released, or before a query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.levels: List[int] = []
+        self.buckets: Dict[int, set] = {}
+        # Product id -> the level it is bucketed at
+        self.placed: Dict[int, int] = {}
+        self.pending = deque()
+        self.alerts = deque()
+
+    def _place(self, product: Product, level: int):
+        bucket = self.buckets.get(level)
+        if bucket is None:
+            bucket = self.buckets[level] = set()
+            insort(self.levels, level)
+        bucket.add(product)
+        self.placed[product.product_id] = level
+
+    def _unplace(self, product: Product, level: int):
+        bucket = self.buckets[level]
+        bucket.discard(product)
+        if not bucket:
+            del self.buckets[level]
+            del self.levels[bisect_right(self.levels, level) - 1]
+
+    def add(self, product: Product):
+        with self._lock:
+            self._place(product, product.stock)
+            if product.stock <= product.reorder_point:
+                self.alerts.append((product, product.stock))
+
+    def moved(self, product: Product, old: int):
+        """Record that `product.stock` changed from `old`; call with its stripe held."""
+        new = product.stock
+        if new == old:
+            return
+        if new <= product.reorder_point < old:
+            self.alerts.append((product, new))
+        self.pending.append(product)
+
+    def _apply(self):
+        while self.pending:
+            product = self.pending.popleft()
+            level, new = self.placed[product.product_id], product.stock
+            if level != new:
+                self._unplace(product, level)
+                self._place(product, new)
+
+    def apply(self, wait: bool = True):
+        """Rebucket queued products; without `wait`, leave it to whoever holds the lock."""
+        if self._lock.acquire(wait):
+            try:
+                self._apply()
+            finally:
+                self._lock.release()
+
+    def below(self, threshold: int) -> List[Product]:
+        """Products whose stock is strictly below `threshold`, lowest first."""
+        with self._lock:
+            self._apply()
+            end = bisect_right(self.levels, threshold - 1)
+            return [product for level in self.levels[:end] for product in self.buckets[level]]
+
+    def lowest(self, n: int) -> List[Product]:
+        found: List[Product] = []
+        with self._lock:
+            self._apply()
+            for level in self.levels:
+                for product in self.buckets[level]:
+                    if len(found) == n:
+                        return found
+                    found.append(product)
+        return found
+
+    def drain_alerts(self) -> List[Tuple[Product, int]]:
+        alerts = []
+        while self.alerts:
+            alerts.append(self.alerts.popleft())
+        return alerts
+
+class Inventory:
+    """Thread-safe stock service with cart reservations.
+
+    Products are guarded by a fixed set of striped locks, so carts touching
+    different products rarely contend. A reservation holds units for a cart
+    until it expires; expired ones are released lazily, from a per-product
+    min-heap on expiry time, whenever that product is next locked. Checkout
+    takes every stripe it needs in ascending order, which keeps concurrent
+    checkouts deadlock-free and makes each commit all-or-nothing.
+    """
+    STRIPES = 64
+
+    def __init__(self, stripes: int = STRIPES):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._ids = count(1)
+        self._reservations: Dict[int, Reservation] = {}
+        self._expiries: Dict[int, List[Tuple[float, int]]] = {}
+        self.stock_index = StockIndex()
+
+    def track(self, product: Product):
+        self.stock_index.add(product)
+
+    def restock(self, product: Product, quantity: int):
+        with self._locks[self._stripe(product)]:
+            old = product.stock
+            product.stock += quantity
+            self.stock_index.moved(product, old)
+        self.stock_index.apply(wait=False)
+
+    def _stripe(self, product: Product) -> int:
+        return product.product_id % len(self._locks)
+
+    def _expire(self, product: Product, now: float):
+        heap = self._expiries.get(product.product_id)
+        while heap and heap[0][0] <= now:
+            _, reservation_id = heapq.heappop(heap)
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is not None:
+                product.reserved -= reservation.quantity
+
+    def reserve(self, product: Product, quantity: int, ttl: float) -> Optional[int]:
+        """Hold `quantity` units for `ttl` seconds; returns the reservation id, or None if short."""
+        with self._locks[self._stripe(product)]:
+            now = time.monotonic()
+            self._expire(product, now)
+            if not 0 < quantity <= product.available:
+                return None
+            reservation_id = next(self._ids)
+            self._reservations[reservation_id] = Reservation(product, quantity, now + ttl)
+            heapq.heappush(self._expiries.setdefault(product.product_id, []), (now + ttl, reservation_id))
+            product.reserved += quantity
+            return reservation_id
+
+    def release(self, lines: List[Tuple[Product, int, int]]):
+        """Give back the units held by (product, quantity, reservation id) lines."""
+        for product, _, reservation_id in lines:
+            with self._locks[self._stripe(product)]:
+                reservation = self._reservations.pop(reservation_id, None)
+                if reservation is not None:
+                    product.reserved -= reservation.quantity
+
+    def commit(self, lines: List[Tuple[Product, int, int]]) -> bool:
+        """Atomically turn a cart's reservations into sales.
+
+        Lines whose reservation has expired are re-checked against available
+        stock; if any product falls short nothing is sold and False is returned.
+        """
+        stripes = sorted({self._stripe(product) for product, _, _ in lines})
+        for stripe in stripes:
+            self._locks[stripe].acquire()
+        try:
+            now = time.monotonic()
+            shortfall: Dict[Product, int] = {}
+            for product, quantity, reservation_id in lines:
+                self._expire(product, now)
+                if reservation_id not in self._reservations:
+                    shortfall[product] = shortfall.get(product, 0) + quantity
+            if any(quantity > product.available for product, quantity in shortfall.items()):
+                return False
+            for product, quantity, reservation_id in lines:
+                reservation = self._reservations.pop(reservation_id, None)
+                if reservation is not None:
+                    product.reserved -= reservation.quantity
+                product.stock -= quantity
+                self.stock_index.moved(product, product.stock + quantity)
+            return True
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+            self.stock_index.apply(wait=False)
 
 class Store:
-    products: List[Product] = []
+    PAGE_SIZE = 20
+    # Products by stable id (in insertion order) and by case-folded name
+    products: Dict[int, Product] = {}
+    by_name: Dict[str, Product] = {}
+    inventory = Inventory()
+    _next_id = 1
+
+    @classmethod
+    def register(cls, name: str, price: float, stock: int, reorder_point: int = 0) -> Product:
+        if name.casefold() in cls.by_name:
+            raise ValueError(f"A product named '{name}' already exists")
+        product = Product(cls._next_id, name, price, stock, reorder_point)
+        cls._next_id += 1
+        cls.products[product.product_id] = product
+        cls.by_name[name.casefold()] = product
+        cls.inventory.track(product)
+        return product
+
+    @classmethod
+    def find(cls, key: str) -> Optional[Product]:
+        """Look a product up by id (e.g. '42' or '#42') or by exact name."""
+        key = key.strip()
+        if key.lstrip('#').isdigit():
+            product = cls.products.get(int(key.lstrip('#')))
+            if product is not None:
+                return product
+        return cls.by_name.get(key.casefold())
+
+    @classmethod
+    def select_product(cls) -> Optional[Product]:
+        key = input("Product id or name (blank to browse): ").strip()
+        if not key:
+            cls.show_products()
+            key = input("Product id or name: ").strip()
+        product = cls.find(key) if key else None
+        if product is None and key:
+            print("Product not found!")
+        return product
 
     @classmethod
     def add_product(cls):
@@ -18,70 +260,234 @@ class Store:
             name = input("Product name: ").strip()
             price = float(input("Price: $"))
             stock = int(input("Stock quantity: "))
-            if not name or price <= 0 or stock < 0:
+            reorder_point = int(input("Reorder point [0]: ").strip() or 0)
+            if not name or price <= 0 or stock < 0 or reorder_point < 0:
                 raise ValueError("Invalid input")
-            cls.products.append(Product(name, price, stock))
-            print("Product added successfully!")
+            product = cls.register(name, price, stock, reorder_point)
+            print(f"Product added successfully with id #{product.product_id}!")
+            cls.show_alerts()
         except ValueError as e:
             print(f"Error: {e}")
 
+    @classmethod
+    def show_alerts(cls):
+        for product, stock in cls.inventory.stock_index.drain_alerts():
+            print(f"REORDER: {product.name} is down to {stock} (reorder point {product.reorder_point})")
+
+    @classmethod
+    def restock_product(cls):
+        product = cls.select_product()
+        if product is None:
+            return
+        try:
+            quantity = int(input("Units received: "))
+            if quantity <= 0:
+                raise ValueError("Invalid input")
+            cls.inventory.restock(product, quantity)
+            print("Stock updated!")
+        except ValueError as e:
+            print(f"Error: {e}")
+
+    @classmethod
+    def show_low_stock(cls):
+        cls.show_alerts()
+        try:
+            query = input("Threshold, or 'top N' for the N lowest [top 10]: ").strip().lower() or 'top 10'
+            if query.startswith('top'):
+                products = cls.inventory.stock_index.lowest(int(query[3:].strip() or 10))
+                title = f"{len(products)} Lowest Stock"
+            else:
+                products = cls.inventory.stock_index.below(int(query))
+                title = f"{len(products)} Products Below {int(query)}"
+        except ValueError:
+            print("Please enter a valid number!")
+            return
+        if not products:
+            print("No products match.")
+            return
+        print(f"\n{title}:")
+        print("-" * 40)
+        for product in products:
+            print(f"#{product.product_id:<7} {product.name:<25} stock {product.stock:>6} (reorder at {product.reorder_point})")
+
+    @classmethod
+    def list_products(cls, page: int = 1, text: str = '', in_stock: bool = False) -> List[Product]:
+        """One page of products in id order, optionally filtered by name and availability."""
+        matches = iter(cls.products.values())
+        if text:
+            text = text.casefold()
+            matches = (p for p in matches if text in p.name.casefold())
+        if in_stock:
+            matches = (p for p in matches if p.available > 0)
+        start = (page - 1) * cls.PAGE_SIZE
+        return list(islice(matches, start, start + cls.PAGE_SIZE))
+
     @classmethod
     def show_products(cls):
         if not cls.products:
             print("No products available.")
             return
-        print("\nProduct List:")
-        print("-" * 40)
-        for idx, product in enumerate(cls.products, 1):
-            print(f"{idx}. {product}")
+        text = input("Filter by name (blank for all): ").strip()
+        in_stock = input("Only items in stock? (y/n) [n]: ").strip().lower() == 'y'
+        page = 1
+        while True:
+            products = cls.list_products(page, text, in_stock)
+            if not products:
+                print("No products match." if page == 1 else "No more products.")
+                return
+            print(f"\nProduct List (page {page}):")
+            print("-" * 40)
+            for product in products:
+                print(product)
+            if len(products) < cls.PAGE_SIZE:
+                return
+            if input("Enter for next page, q to stop: ").strip().lower() == 'q':
+                return
+            page += 1
+
+    @classmethod
+    def run_benchmark(cls):
+        try:
+            threads = [int(n) for n in (input("Thread counts [1,2,4,8,16]: ").strip() or "1,2,4,8,16").split(',')]
+            products = int(input("Products [50]: ").strip() or 50)
+            checkouts = int(input("Checkouts per thread [2000]: ").strip() or 2000)
+        except ValueError:
+            print("Please enter valid numbers!")
+            return
+        print(benchmark_contention(threads, products, checkouts))
 
 class Cart:
-    items: Dict[Product, int] = {}
+    """One shopper's cart; stock is reserved on add and sold on checkout."""
+    RESERVATION_TTL = 15 * 60
 
-    @classmethod
-    def add_to_cart(cls):
-        Store.show_products()
+    def __init__(self, inventory: Inventory, ttl: float = RESERVATION_TTL):
+        self.inventory = inventory
+        self.ttl = ttl
+        # Product id -> quantity; lines hold the reservations behind them
+        self.items: Dict[int, int] = {}
+        self.lines: List[Tuple[Product, int, int]] = []
+
+    def add(self, product: Product, quantity: int) -> bool:
+        reservation_id = self.inventory.reserve(product, quantity, self.ttl)
+        if reservation_id is None:
+            return False
+        self.items[product.product_id] = self.items.get(product.product_id, 0) + quantity
+        self.lines.append((product, quantity, reservation_id))
+        return True
+
+    def total(self) -> float:
+        return sum(product.price * quantity for product, quantity, _ in self.lines)
+
+    def checkout(self) -> bool:
+        if not self.inventory.commit(self.lines):
+            return False
+        self.items.clear()
+        self.lines.clear()
+        return True
+
+    def clear(self):
+        self.inventory.release(self.lines)
+        self.items.clear()
+        self.lines.clear()
+
+    def add_to_cart(self):
         if not Store.products:
+            print("No products available.")
+            return
+        product = Store.select_product()
+        if product is None:
             return
         try:
-            choice = int(input("Select product number: ")) - 1
-            if 0 <= choice < len(Store.products):
-                product = Store.products[choice]
-                quantity = int(input(f"Quantity (max {product.stock}): "))
-                if 0 < quantity <= product.stock:
-                    cls.items[product] = cls.items.get(product, 0) + quantity
-                    product.stock -= quantity
-                    print("Added to cart!")
-                else:
-                    print("Invalid quantity!")
+            quantity = int(input(f"Quantity (max {product.available}): "))
+            if self.add(product, quantity):
+                print("Added to cart!")
             else:
-                print("Invalid selection!")
+                print("Invalid quantity!")
         except ValueError:
             print("Please enter a valid number!")
 
-    @classmethod
-    def show_cart(cls):
-        if not cls.items:
+    def show_cart(self):
+        if not self.items:
             print("Your cart is empty.")
             return
-        total = 0.0
         print("\nYour Shopping Cart:")
         print("-" * 40)
-        for product, quantity in cls.items.items():
-            subtotal = product.price * quantity
-            print(f"{product.name} x{quantity} = ${subtotal:.2f}")
-            total += subtotal
+        for product_id, quantity in self.items.items():
+            product = Store.products[product_id]
+            print(f"{product.name} x{quantity} = ${product.price * quantity:.2f}")
         print("-" * 40)
-        print(f"TOTAL: ${total:.2f}")
+        print(f"TOTAL: ${self.total():.2f}")
+
+    def check_out(self):
+        if not self.items:
+            print("Your cart is empty.")
+            return
+        self.show_cart()
+        if self.checkout():
+            print("Thank you for your purchase!")
+            Store.show_alerts()
+        else:
+            print("Some reservations expired and the stock is gone; your cart was emptied.")
+            self.clear()
+
+def benchmark_contention(thread_counts: List[int], products: int = 50, checkouts: int = 2000,
+                         stock: int = 1_000_000) -> str:
+    """Checkouts/s as shoppers are added, with striped locks vs one global lock.
+
+    Each shopper thread repeatedly fills a cart with 1-3 random products and
+    checks out. After every run the stock is verified: units sold plus units
+    left must equal the starting stock and nothing may stay reserved.
+    """
+    lines = ["\nContention Benchmark:", "=" * 50,
+             f"{'threads':>7} | {'striped ops/s':>14} | {'single lock ops/s':>17}"]
+    for threads in thread_counts:
+        rates = []
+        for stripes in (Inventory.STRIPES, 1):
+            inventory = Inventory(stripes)
+            catalog = [Product(i, f"item-{i}", 1.0, stock) for i in range(products)]
+            for product in catalog:
+                inventory.track(product)
+            sold = [0] * threads
+
+            def shopper(slot: int):
+                rng = random.Random(slot)
+                cart = Cart(inventory, ttl=60)
+                for _ in range(checkouts):
+                    for product in rng.sample(catalog, rng.randint(1, 3)):
+                        cart.add(product, 1)
+                    units = len(cart.lines)
+                    if cart.checkout():
+                        sold[slot] += units
+                    else:
+                        cart.clear()
+
+            workers = [threading.Thread(target=shopper, args=(slot,)) for slot in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            left = sum(product.stock for product in catalog)
+            if left + sum(sold) != stock * products or any(p.reserved for p in catalog):
+                raise RuntimeError("inventory invariant violated")
+            rates.append(threads * checkouts / elapsed)
+        lines.append(f"{threads:>7} | {rates[0]:>14,.0f} | {rates[1]:>17,.0f}")
+    return "\n".join(lines)
 
 def main():
+    cart = Cart(Store.inventory)
     menu = {
         '1': ('Add Product', Store.add_product),
         '2': ('View Products', Store.show_products),
-        '3': ('Add to Cart', Cart.add_to_cart),
-        '4': ('View Cart', Cart.show_cart),
-        '5': ('Checkout', None),
-        '6': ('Exit', None)
+        '3': ('Add to Cart', cart.add_to_cart),
+        '4': ('View Cart', cart.show_cart),
+        '5': ('Checkout', cart.check_out),
+        '6': ('Restock Product', Store.restock_product),
+        '7': ('Low Stock', Store.show_low_stock),
+        '8': ('Contention Benchmark', Store.run_benchmark),
+        '9': ('Exit', None)
     }
 
     while True:
@@ -89,13 +495,10 @@ def main():
         print("=" * 30)
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
-        
-        choice = input("\nEnter your choice (1-6): ")
-        if choice == '5':
-            Cart.show_cart()
-            print("Thank you for your purchase!")
-            Cart.items.clear()
-        elif choice == '6':
+
+        choice = input("\nEnter your choice (1-9): ")
+        if choice == '9':
+            cart.clear()
             print("Goodbye!")
             break
         elif choice in menu:
@@ -104,4 +507,4 @@ def main():
             print("Invalid choice!")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
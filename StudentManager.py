@@ -1,51 +1,248 @@
+import csv
 import json
+import math
+import mmap
 import os
-from typing import Dict, List
+import struct
+from array import array
+from typing import Dict, List, Tuple
+
+from gradebook import GradebookReader, ScoreRanking
 
 class Student:
     def __init__(self, name: str):
         self.name = name
         self.grades: List[float] = []
+        # Running totals so average() never re-sums the grade list
+        self.total = 0.0
+        self.count = 0
 
     def add_grade(self, grade: float):
         if 0 <= grade <= 20:
             self.grades.append(grade)
+            self.total += grade
+            self.count += 1
         else:
             raise ValueError("Grade must be between 0 and 20")
 
     def average(self) -> float:
-        return round(sum(self.grades) / len(self.grades), 2) if self.grades else 0.0
+        return round(self.total / self.count, 2) if self.count else 0.0
 
     def to_dict(self) -> Dict:
-        return {'name': self.name, 'grades': self.grades}
+        return {'name': self.name, 'grades': list(self.grades)}
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Student':
         student = cls(data['name'])
         student.grades = data['grades']
+        student.total = sum(student.grades)
+        student.count = len(student.grades)
         return student
 
+class GradeStore:
+    """Binary student storage: a packed snapshot plus an append-only log.
+
+    The snapshot holds the names, then per-student grade counts and running
+    totals, then every grade as one contiguous float64 array. Loading mmaps
+    it and copies each student's slice straight into an array('d'), so no
+    numbers are parsed. New students and grades are appended to a small log
+    of fixed-layout records that is replayed on load and folded into the
+    snapshot by compact().
+
+    Each compaction bumps a generation number stored in the snapshot
+    header, and a log starts with the generation of the snapshot it
+    extends. A log left behind by a crash after the snapshot was replaced
+    is therefore already folded in and is dropped instead of replayed.
+    """
+    MAGIC = b'SGB2'
+    OLD_MAGIC = b'SGB1'
+    HEADER = b'L'
+    STUDENT = b'S'
+    GRADE = b'G'
+
+    def __init__(self, path: str):
+        self.path = path
+        self.log_path = path + '.log'
+        self.ids: Dict[str, int] = {}
+        self.log_records = 0
+        self.generation = 0
+
+    def load(self) -> Dict[str, Student]:
+        students: Dict[str, Student] = {}
+        self.generation = 0
+        # Before the first compaction the log alone holds every student
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:4] == self.MAGIC:
+                    count, self.generation = struct.unpack_from('<II', mm, 4)
+                    pos = 12
+                elif mm[:4] == self.OLD_MAGIC:
+                    (count,), pos = struct.unpack_from('<I', mm, 4), 8
+                else:
+                    raise ValueError(f"{self.path} is not a grade store")
+                names = []
+                for _ in range(count):
+                    (length,) = struct.unpack_from('<H', mm, pos)
+                    names.append(mm[pos + 2:pos + 2 + length].decode('utf-8'))
+                    pos += 2 + length
+                counts, totals = array('I'), array('d')
+                counts.frombytes(mm[pos:pos + 4 * count])
+                pos += 4 * count
+                totals.frombytes(mm[pos:pos + 8 * count])
+                pos += 8 * count
+                for name, grade_count, total in zip(names, counts, totals):
+                    student = Student(name)
+                    student.grades = array('d')
+                    student.grades.frombytes(mm[pos:pos + 8 * grade_count])
+                    student.total, student.count = total, grade_count
+                    pos += 8 * grade_count
+                    students[name] = student
+        self.ids = {name: i for i, name in enumerate(students)}
+        self._replay(students)
+        return students
+
+    def _replay(self, students: Dict[str, Student]):
+        self.log_records = 0
+        if not os.path.exists(self.log_path):
+            return
+        by_id = list(students.values())
+        with open(self.log_path, 'rb') as f:
+            data = f.read()
+        pos = 0
+        if data[:1] == self.HEADER and len(data) >= 5:
+            (generation,) = struct.unpack_from('<I', data, 1)
+            if generation < self.generation:
+                # Folded into the snapshot by a compaction that crashed
+                # before it could remove the log
+                os.remove(self.log_path)
+                return
+            pos = 5
+        # A record cut short by a crash, or one naming a student that does
+        # not exist, ends the replay and is cut off, so the next append
+        # starts on a record boundary
+        while pos < len(data):
+            kind = data[pos:pos + 1]
+            if kind == self.STUDENT and pos + 3 <= len(data):
+                (length,) = struct.unpack_from('<H', data, pos + 1)
+                if pos + 3 + length > len(data):
+                    break
+                name = data[pos + 3:pos + 3 + length].decode('utf-8')
+                pos += 3 + length
+                if name not in students:
+                    self.ids[name] = len(by_id)
+                    students[name] = Student(name)
+                    by_id.append(students[name])
+            elif kind == self.GRADE and pos + 13 <= len(data):
+                student_id, grade = struct.unpack_from('<Id', data, pos + 1)
+                if student_id >= len(by_id):
+                    break
+                pos += 13
+                by_id[student_id].add_grade(grade)
+            else:
+                break
+            self.log_records += 1
+        if pos < len(data):
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(pos)
+                os.fsync(f.fileno())
+
+    def _append(self, record: bytes):
+        with open(self.log_path, 'ab') as f:
+            if not f.tell():
+                f.write(self.HEADER + struct.pack('<I', self.generation))
+            f.write(record)
+        self.log_records += 1
+
+    def append_student(self, name: str):
+        encoded = name.encode('utf-8')
+        self.ids[name] = len(self.ids)
+        self._append(self.STUDENT + struct.pack('<H', len(encoded)) + encoded)
+
+    def append_grade(self, name: str, grade: float):
+        if name not in self.ids:
+            # Added in bulk but never compacted (the snapshot write failed)
+            self.append_student(name)
+        self._append(self.GRADE + struct.pack('<Id', self.ids[name], grade))
+
+    def compact(self, students: Dict[str, Student]):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC + struct.pack('<II', len(students), self.generation + 1))
+            for name in students:
+                encoded = name.encode('utf-8')
+                f.write(struct.pack('<H', len(encoded)) + encoded)
+            f.write(array('I', (s.count for s in students.values())).tobytes())
+            f.write(array('d', (s.total for s in students.values())).tobytes())
+            for student in students.values():
+                f.write(array('d', student.grades).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.generation += 1
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self.ids = {name: i for i, name in enumerate(students)}
+        self.log_records = 0
+
 class StudentManager:
     FILE = 'students.json'
+    BIN_FILE = 'students.bin'
+    # Fold the append log into the snapshot once it holds this many records
+    COMPACT_AFTER = 10_000
+    LEADERBOARD_SIZE = 10
     students: Dict[str, Student] = {}
+    ranking = ScoreRanking()
+    store = GradeStore(BIN_FILE)
 
     @classmethod
     def _save_to_file(cls):
+        """Rewrite the binary snapshot; single changes go through the log instead."""
+        try:
+            cls.store.compact(cls.students)
+        except IOError as e:
+            print(f"Error saving data: {e}")
+
+    @classmethod
+    def _log(cls, append, *args):
+        try:
+            append(*args)
+            if cls.store.log_records >= cls.COMPACT_AFTER:
+                cls.store.compact(cls.students)
+        except IOError as e:
+            print(f"Error saving data: {e}")
+
+    @classmethod
+    def export_json(cls):
         try:
             with open(cls.FILE, 'w') as f:
                 json.dump({name: s.to_dict() for name, s in cls.students.items()}, f, indent=4)
+            print(f"Exported {len(cls.students)} students to {cls.FILE}")
         except IOError as e:
             print(f"Error saving data: {e}")
 
     @classmethod
     def _load_from_file(cls):
-        if os.path.exists(cls.FILE):
-            try:
+        if cls.store.path != cls.BIN_FILE:
+            cls.store = GradeStore(cls.BIN_FILE)
+        try:
+            if os.path.exists(cls.BIN_FILE) or os.path.exists(cls.store.log_path):
+                cls.students = cls.store.load()
+            elif os.path.exists(cls.FILE):
+                # First run after switching formats: migrate the JSON file
                 with open(cls.FILE, 'r') as f:
                     data = json.load(f)
                     cls.students = {name: Student.from_dict(s_data) for name, s_data in data.items()}
-            except (IOError, json.JSONDecodeError) as e:
-                print(f"Error loading data: {e}")
+                cls.store.compact(cls.students)
+            else:
+                return
+        except (IOError, ValueError, struct.error) as e:
+            print(f"Error loading data: {e}")
+            return
+
+        cls.ranking = ScoreRanking()
+        for name, student in cls.students.items():
+            if student.count:
+                cls.ranking.add(name, student.average())
 
     @classmethod
     def add_student(cls):
@@ -57,7 +254,7 @@ class StudentManager:
             print("Student already exists!")
         else:
             cls.students[name] = Student(name)
-            cls._save_to_file()
+            cls._log(cls.store.append_student, name)
             print(f"Student {name} added successfully.")
 
     @classmethod
@@ -68,8 +265,13 @@ class StudentManager:
             return
         try:
             grade = float(input("Grade (0-20): "))
-            cls.students[name].add_grade(grade)
-            cls._save_to_file()
+            student = cls.students[name]
+            old_average = student.average() if student.count else None
+            student.add_grade(grade)
+            if old_average is not None:
+                cls.ranking.remove(name, old_average)
+            cls.ranking.add(name, student.average())
+            cls._log(cls.store.append_grade, name, grade)
             print("Grade added successfully.")
         except ValueError as e:
             print(f"Error: {e}")
@@ -83,7 +285,7 @@ class StudentManager:
         print("-" * 40)
         for name, student in cls.students.items():
             avg = student.average()
-            print(f"{name:<20} | Grades: {student.grades} | Average: {avg}")
+            print(f"{name:<20} | Grades: {list(student.grades)} | Average: {avg}")
 
     @classmethod
     def show_average(cls):
@@ -94,6 +296,85 @@ class StudentManager:
         else:
             print("Student not found!")
 
+    @classmethod
+    def show_ranking(cls):
+        if not cls.ranking.total:
+            print("No graded students available.")
+            return
+        name = input("Student name (Enter for top 10%): ").strip()
+        if name:
+            student = cls.students.get(name)
+            if not student or not student.count:
+                print("Student not found or has no grades!")
+                return
+            rank = cls.ranking.rank_of(student.average())
+            print(f"{name} is ranked #{rank} of {cls.ranking.total}")
+            return
+
+        count = max(1, math.ceil(cls.ranking.total / 10))
+        print("\nTop 10% Students:")
+        print("-" * 40)
+        for rank, name, average in cls.ranking.best(count):
+            print(f"#{rank:<6} {name:<20} | Average: {average}")
+
+    @classmethod
+    def show_leaderboard(cls):
+        top = cls.ranking.best(cls.LEADERBOARD_SIZE)[:cls.LEADERBOARD_SIZE]
+        if not top:
+            print("No graded students available.")
+            return
+        print(f"\nLeaderboard (Top {cls.LEADERBOARD_SIZE}):")
+        print("-" * 40)
+        for rank, name, average in top:
+            print(f"{rank:>2}. {name:<20} | Average: {average}")
+
+    @classmethod
+    def bulk_import(cls, path: str) -> Tuple[int, int, GradebookReader]:
+        """Add every valid grade in a gradebook CSV (one grade per row), creating missing students.
+
+        Returns (grades added, students created, reader). Nothing changes
+        unless the whole file parses; rankings are then rebuilt and the
+        snapshot written once.
+        """
+        reader = GradebookReader(path)
+        per_student: Dict[str, List[float]] = {}
+        for name, grade in reader.read():
+            per_student.setdefault(name, []).append(grade)
+
+        added = created = 0
+        for name, grades in per_student.items():
+            student = cls.students.get(name)
+            if student is None:
+                student = cls.students[name] = Student(name)
+                created += 1
+            student.grades.extend(grades)
+            student.total += sum(grades)
+            student.count += len(grades)
+            added += len(grades)
+
+        if added or created:
+            cls.ranking = ScoreRanking()
+            for name, student in cls.students.items():
+                if student.count:
+                    cls.ranking.add(name, student.average())
+            cls._save_to_file()
+        return added, created, reader
+
+    @classmethod
+    def import_gradebook(cls):
+        path = input("Gradebook CSV path (name,grade per row): ").strip()
+        if not os.path.exists(path):
+            print("File not found!")
+            return
+        try:
+            added, created, reader = cls.bulk_import(path)
+        except (IOError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Error importing gradebook, nothing was changed: {e}")
+            return
+        print(f"Imported {added} grades ({created} new students), {len(reader.rejects)} rows rejected.")
+        for line in reader.report():
+            print(f"  {line}")
+
 def main():
     StudentManager._load_from_file()
     menu = {
@@ -101,7 +382,11 @@ def main():
         '2': ('Add Grade', StudentManager.add_grade),
         '3': ('View All Students', StudentManager.show_students),
         '4': ('View Student Average', StudentManager.show_average),
-        '5': ('Exit', None)
+        '5': ('Student Ranking', StudentManager.show_ranking),
+        '6': ('Leaderboard', StudentManager.show_leaderboard),
+        '7': ('Export JSON', StudentManager.export_json),
+        '8': ('Import Gradebook', StudentManager.import_gradebook),
+        '9': ('Exit', None)
     }
 
     while True:
@@ -110,8 +395,9 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
         
-        choice = input("\nEnter your choice (1-5): ")
-        if choice == '5':
+        choice = input("\nEnter your choice (1-9): ")
+        if choice == '9':
+            StudentManager._save_to_file()
             print("Goodbye!")
             break
         if choice in menu:
@@ -0,0 +1,215 @@
+"""Gradebook helpers shared by studentgrades.py and StudentManager.py.
+
+Not an app on its own: keep it next to the scripts that import it.
+"""
+import csv
+import math
+import os
+from typing import Dict, List, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ScoreRanking:
+    """Order statistics over students by a 0-20 score (a grade or an average).
+
+    Scores are bucketed at hundredth-of-a-point precision into 2001 bins. A
+    Fenwick tree counts students per bin, so rank-of, k-th and range counts
+    are O(log bins). Names are kept per bin, which lets pages in rank order
+    be read straight off the bins without sorting everyone. Rank 1 is the
+    highest score; equal scores share a rank.
+    """
+    SCALE = 100
+    BINS = 20 * SCALE + 1
+
+    @classmethod
+    def _bin(cls, score: float) -> int:
+        return min(max(int(round(score * cls.SCALE)), 0), cls.BINS - 1)
+
+    def __init__(self):
+        self.total = 0
+        self.tree: List[int] = [0] * (self.BINS + 1)
+        self.members: List[Set[str]] = [set() for _ in range(self.BINS)]
+
+    def _update(self, key: int, delta: int):
+        i = key + 1
+        while i <= self.BINS:
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, key: int) -> int:
+        """Number of students in bins 0..key."""
+        count, i = 0, min(key, self.BINS - 1) + 1
+        while i > 0:
+            count += self.tree[i]
+            i -= i & -i
+        return count
+
+    def add(self, name: str, score: float):
+        key = self._bin(score)
+        self.members[key].add(name)
+        self._update(key, 1)
+        self.total += 1
+
+    def remove(self, name: str, score: float):
+        key = self._bin(score)
+        self.members[key].discard(name)
+        self._update(key, -1)
+        self.total -= 1
+
+    def replace(self, name: str, old: float, new: float):
+        self.remove(name, old)
+        self.add(name, new)
+
+    def rebuild(self, scores: Dict[str, float]):
+        self.__init__()
+        for name, score in scores.items():
+            self.members[self._bin(score)].add(name)
+        # Linear-time Fenwick construction from the per-bin counts
+        for i in range(1, self.BINS + 1):
+            self.tree[i] += len(self.members[i - 1])
+            parent = i + (i & -i)
+            if parent <= self.BINS:
+                self.tree[parent] += self.tree[i]
+        self.total = len(scores)
+
+    def rank_of(self, score: float) -> int:
+        return self.total - self._prefix(self._bin(score)) + 1
+
+    def _kth_key(self, k: int) -> int:
+        """Bin holding the k-th highest score (1-based)."""
+        target, pos = self.total - k + 1, 0
+        step = 1 << self.BINS.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.BINS and self.tree[nxt] < target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+    def kth(self, k: int) -> float:
+        if not 1 <= k <= self.total:
+            raise ValueError(f"Rank must be between 1 and {self.total}")
+        return self._kth_key(k) / self.SCALE
+
+    def count_between(self, low: float, high: float) -> int:
+        """Students scoring from `low` to `high` inclusive, in either order."""
+        if low > high:
+            low, high = high, low
+        return self._prefix(self._bin(high)) - self._prefix(self._bin(low) - 1)
+
+    def page(self, start: int, size: int) -> List[Tuple[int, str, float]]:
+        """(rank, name, score) for positions start..start+size-1 in rank order."""
+        if not 1 <= start <= self.total:
+            return []
+        key = self._kth_key(start)
+        above = self.total - self._prefix(key)
+        skip = start - above - 1
+        rows = []
+        while key >= 0 and len(rows) < size:
+            names = sorted(self.members[key])
+            for name in names[skip:size - len(rows) + skip]:
+                rows.append((above + 1, name, key / self.SCALE))
+            above += len(names)
+            skip = 0
+            key -= 1
+        return rows
+
+    def best(self, count: int) -> List[Tuple[int, str, float]]:
+        """(rank, name, score) for the top `count` students, ties included."""
+        rows, above = [], 0
+        for key in range(self.BINS - 1, -1, -1):
+            if above >= count:
+                break
+            names = self.members[key]
+            for name in sorted(names):
+                rows.append((above + 1, name, key / self.SCALE))
+            above += len(names)
+        return rows
+
+class GradebookReader:
+    """Reads a name,grade gradebook CSV in fixed-size batches and validates it.
+
+    Each batch is converted and range-checked with one numpy call when numpy
+    is installed; a batch holding unparseable text, or any batch without
+    numpy, is converted value by value. read() returns only after the whole
+    file has parsed, so callers apply nothing from a file that fails halfway.
+    Bad rows are collected as (line, row, reason) rather than stopping the read.
+    """
+    BATCH_SIZE = 50_000
+    HEADERS = {'grade', 'grades', 'score', 'note'}
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rejects: List[Tuple[int, List[str], str]] = []
+
+    def read(self) -> List[Tuple[str, float]]:
+        accepted: List[Tuple[str, float]] = []
+        with open(self.path, 'r', newline='', encoding='utf-8-sig') as file:
+            batch = []
+            for line, row in enumerate(csv.reader(file), 1):
+                if line == 1 and len(row) >= 2 and row[1].strip().lower() in self.HEADERS:
+                    continue
+                batch.append((line, row))
+                if len(batch) >= self.BATCH_SIZE:
+                    accepted.extend(self.validate(batch))
+                    batch = []
+            if batch:
+                accepted.extend(self.validate(batch))
+        return accepted
+
+    def validate(self, batch: List[Tuple[int, List[str]]]) -> List[Tuple[str, float]]:
+        names = [row[0].strip() if row else '' for _, row in batch]
+        raw = [row[1].strip() if len(row) >= 2 else '' for _, row in batch]
+        values = self._parse(raw)
+        if np is not None:
+            in_range = ((values >= 0) & (values <= 20)).tolist()
+            values = values.tolist()
+        else:
+            in_range = [0 <= value <= 20 for value in values]
+
+        accepted = []
+        for (line, row), name, value, ok in zip(batch, names, values, in_range):
+            if not name:
+                self.rejects.append((line, row, "missing name"))
+            elif math.isnan(value):
+                self.rejects.append((line, row, "grade is not a number"))
+            elif not ok:
+                self.rejects.append((line, row, "grade must be between 0-20"))
+            else:
+                accepted.append((name, value))
+        return accepted
+
+    @staticmethod
+    def _parse(raw: List[str]):
+        """float64 array (numpy) or list of floats; NaN marks unparseable text."""
+        if np is not None:
+            try:
+                return np.asarray(raw, dtype=np.float64)
+            except ValueError:
+                pass
+        values = []
+        for text in raw:
+            try:
+                values.append(float(text))
+            except ValueError:
+                values.append(math.nan)
+        return np.asarray(values, dtype=np.float64) if np is not None else values
+
+    def report(self, limit: int = 10) -> List[str]:
+        lines = [f"line {line}: {reason} -> {','.join(row)}" for line, row, reason in self.rejects[:limit]]
+        if len(self.rejects) > limit:
+            lines.append(f"... and {len(self.rejects) - limit} more")
+        return lines
+
+    def write_rejects(self) -> str:
+        path = os.path.splitext(self.path)[0] + '.rejects.csv'
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['line', 'reason', 'row'])
+            for line, row, reason in self.rejects:
+                writer.writerow([line, reason, ','.join(row)])
+        return path
@@ -1,10 +1,112 @@
 import csv
+import math
 import os
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
+
+from gradebook import GradebookReader, ScoreRanking
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class GradeStats:
+    """Running aggregates over the 0-20 grades, updated on every change.
+
+    Mean and variance use Welford's method (including its reverse step for
+    removals). A histogram at hundredth-of-a-point precision gives exact
+    min/max, median and percentiles by scanning 2001 bins instead of
+    sorting every grade.
+    """
+    SCALE = 100
+    BINS = 20 * SCALE + 1
+    # Bulk rebuilds switch to NumPy (when installed) above this many grades
+    NUMPY_THRESHOLD = 100_000
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.bins: List[int] = [0] * self.BINS
+
+    @classmethod
+    def _bin(cls, grade: float) -> int:
+        # Clamp so a hand-edited grades.csv can't index outside the histogram
+        return min(max(int(round(grade * cls.SCALE)), 0), cls.BINS - 1)
+
+    def add(self, grade: float):
+        self.count += 1
+        delta = grade - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (grade - self.mean)
+        self.bins[self._bin(grade)] += 1
+
+    def remove(self, grade: float):
+        self.bins[self._bin(grade)] -= 1
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self.m2 = 0.0
+            return
+        delta = grade - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (grade - self.mean))
+
+    def replace(self, old: float, new: float):
+        self.remove(old)
+        self.add(new)
+
+    def rebuild(self, grades: Iterable[float]):
+        grades = list(grades)
+        self.__init__()
+        if np is not None and len(grades) >= self.NUMPY_THRESHOLD:
+            values = np.asarray(grades, dtype=np.float64)
+            self.count = len(values)
+            self.mean = float(values.mean())
+            self.m2 = float(((values - self.mean) ** 2).sum())
+            keys = np.clip(np.rint(values * self.SCALE), 0, self.BINS - 1).astype(np.int64)
+            self.bins = np.bincount(keys, minlength=self.BINS).tolist()
+            return
+        for grade in grades:
+            self.add(grade)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile, accurate to the histogram precision."""
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for key, hits in enumerate(self.bins):
+            seen += hits
+            if seen >= rank:
+                return key / self.SCALE
+        return 0.0
+
+    @property
+    def lowest(self) -> float:
+        return self.percentile(0)
+
+    @property
+    def highest(self) -> float:
+        return self.percentile(100)
+
+    def histogram(self, width: int = 2) -> List[Tuple[int, int, int]]:
+        """(from, to, count) per `width`-point bucket; 20 falls in the last."""
+        buckets = []
+        step = width * self.SCALE
+        for start in range(0, 20 * self.SCALE, step):
+            end = start + step + (1 if start + step >= 20 * self.SCALE else 0)
+            buckets.append((start // self.SCALE, (start + step) // self.SCALE,
+                            sum(self.bins[start:end])))
+        return buckets
 
 class GradeManager:
     FILE = 'grades.csv'
+    PAGE_SIZE = 20
     grades: Dict[str, float] = {}
+    stats = GradeStats()
+    ranking = ScoreRanking()
 
     @classmethod
     def load_grades(cls):
@@ -16,6 +118,8 @@ class GradeManager:
                         row[0]: float(row[1])
                         for row in reader if len(row) >= 2 and row[0]
                     }
+                cls.stats.rebuild(cls.grades.values())
+                cls.ranking.rebuild(cls.grades)
             except Exception as e:
                 print(f"❌ Error loading grades: {e}")
 
@@ -45,6 +149,8 @@ class GradeManager:
                 raise ValueError("Grade must be between 0-20")
                 
             cls.grades[name] = grade
+            cls.stats.add(grade)
+            cls.ranking.add(name, grade)
             cls.save_grades()
             print("✅ Student added successfully!")
         except ValueError as e:
@@ -62,6 +168,8 @@ class GradeManager:
             if not 0 <= new_grade <= 20:
                 raise ValueError("Grade must be between 0-20")
                 
+            cls.stats.replace(cls.grades[name], new_grade)
+            cls.ranking.replace(name, cls.grades[name], new_grade)
             cls.grades[name] = new_grade
             cls.save_grades()
             print("✅ Grade updated successfully!")
@@ -74,7 +182,9 @@ class GradeManager:
         if name in cls.grades:
             confirm = input(f"Delete {name}? (y/n): ").lower()
             if confirm == 'y':
-                del cls.grades[name]
+                grade = cls.grades.pop(name)
+                cls.stats.remove(grade)
+                cls.ranking.remove(name, grade)
                 cls.save_grades()
                 print("✅ Student deleted successfully!")
         else:
@@ -102,26 +212,126 @@ class GradeManager:
             print("📭 No students in records")
             return
             
-        print("\n📊 All Students:")
-        print("=" * 40)
-        for name, grade in sorted(cls.grades.items()):
-            print(f"{name:<20}: {grade:.2f}")
+        if input("Order by (n)ame or (r)ank? [n]: ").strip().lower() != 'r':
+            print("\n📊 All Students:")
+            print("=" * 40)
+            for name, grade in sorted(cls.grades.items()):
+                print(f"{name:<20}: {grade:.2f}")
+            return
+
+        start = 1
+        while start <= cls.ranking.total:
+            print(f"\n🏆 Students by Rank ({start}-"
+                  f"{min(start + cls.PAGE_SIZE - 1, cls.ranking.total)} of {cls.ranking.total}):")
+            print("=" * 40)
+            for rank, name, grade in cls.ranking.page(start, cls.PAGE_SIZE):
+                print(f"#{rank:<6} {name:<20}: {grade:.2f}")
+            start += cls.PAGE_SIZE
+            if start <= cls.ranking.total and input("Enter for next page, q to stop: ").strip().lower() == 'q':
+                break
 
     @classmethod
-    def show_stats(cls):
+    def rank_queries(cls):
         if not cls.grades:
             print("📭 No students in records")
             return
-            
-        grades = cls.grades.values()
-        average = sum(grades) / len(grades)
-        highest = max(grades)
-        lowest = min(grades)
-        
+
+        print("\n1. Rank of a student\n2. Top percent of students\n3. Count in grade range")
+        choice = input("Choose query: ").strip()
+        try:
+            if choice == '1':
+                name = input("Student name: ").strip()
+                if name not in cls.grades:
+                    print("❌ Student not found!")
+                    return
+                rank = cls.ranking.rank_of(cls.grades[name])
+                print(f"🏆 {name} is ranked #{rank} of {cls.ranking.total}")
+            elif choice == '2':
+                percent = float(input("Top percent (e.g. 10): ").strip())
+                if not 0 < percent <= 100:
+                    raise ValueError("Percent must be between 0-100")
+                count = max(1, math.ceil(percent / 100 * cls.ranking.total))
+                cutoff = cls.ranking.kth(count)
+                # Everyone tied with the cutoff grade is included
+                count = cls.ranking.count_between(cutoff, 20)
+                print(f"\n🏆 Top {percent:g}% (grade ≥ {cutoff:.2f}):")
+                for rank, name, grade in cls.ranking.page(1, count):
+                    print(f"#{rank:<6} {name:<20}: {grade:.2f}")
+            elif choice == '3':
+                low = float(input("From grade: ").strip())
+                high = float(input("To grade: ").strip())
+                low, high = min(low, high), max(low, high)
+                print(f"📊 {cls.ranking.count_between(low, high)} students between {low:.2f} and {high:.2f}")
+            else:
+                print("❌ Invalid choice!")
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+
+    @classmethod
+    def bulk_import(cls, path: str) -> Tuple[int, int, GradebookReader]:
+        """Upsert every valid row of a gradebook CSV; returns (added, updated, reader).
+
+        Nothing changes unless the whole file parses. Statistics and rankings
+        are then rebuilt once and the file saved once, rather than per
+        student as add_student does.
+        """
+        reader = GradebookReader(path)
+        rows = reader.read()
+        added = updated = 0
+        for name, grade in rows:
+            if name in cls.grades:
+                updated += 1
+            else:
+                added += 1
+            cls.grades[name] = grade
+        if rows:
+            cls.stats.rebuild(cls.grades.values())
+            cls.ranking.rebuild(cls.grades)
+            cls.save_grades()
+        return added, updated, reader
+
+    @classmethod
+    def import_gradebook(cls):
+        path = input("Gradebook CSV path (name,grade): ").strip()
+        if not os.path.exists(path):
+            print("❌ File not found!")
+            return
+        try:
+            added, updated, reader = cls.bulk_import(path)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"❌ Error importing gradebook, nothing was changed: {e}")
+            return
+        print(f"✅ Imported: {added} added, {updated} updated, {len(reader.rejects)} rejected")
+        if reader.rejects:
+            for line in reader.report():
+                print(f"  {line}")
+            try:
+                print(f"📄 Full reject report: {reader.write_rejects()}")
+            except OSError as e:
+                print(f"❌ Error writing reject report: {e}")
+
+    @classmethod
+    def show_stats(cls):
+        stats = cls.stats
+        if not stats.count:
+            print("📭 No students in records")
+            return
+
         print("\n📈 Grade Statistics:")
-        print(f"Average: {average:.2f}")
-        print(f"Highest: {highest:.2f}")
-        print(f"Lowest: {lowest:.2f}")
+        print(f"Students: {stats.count}")
+        print(f"Average: {stats.mean:.2f}")
+        print(f"Std Dev: {stats.std_dev:.2f}")
+        print(f"Median: {stats.percentile(50):.2f}")
+        print(f"25th / 75th / 90th percentile: {stats.percentile(25):.2f} / "
+              f"{stats.percentile(75):.2f} / {stats.percentile(90):.2f}")
+        print(f"Highest: {stats.highest:.2f}")
+        print(f"Lowest: {stats.lowest:.2f}")
+
+        print("\n📊 Distribution:")
+        widest = max(count for _, _, count in stats.histogram()) or 1
+        for start, end, count in stats.histogram():
+            bar = "█" * round(30 * count / widest)
+            print(f"{start:>2}-{end:<2} | {bar} {count}")
 
 def main():
     GradeManager.load_grades()
@@ -133,7 +343,9 @@ def main():
         '4': ('Search Student', GradeManager.search_student),
         '5': ('View All', GradeManager.show_all),
         '6': ('View Stats', GradeManager.show_stats),
-        '7': ('Exit', None)
+        '7': ('Rank Queries', GradeManager.rank_queries),
+        '8': ('Import Gradebook', GradeManager.import_gradebook),
+        '9': ('Exit', None)
     }
 
     while True:
@@ -142,8 +354,8 @@ def main():
         for k, (v, _) in menu.items():
             print(f"{k}. {v}")
             
-        choice = input("\nEnter choice (1-7): ")
-        if choice == '7':
+        choice = input("\nEnter choice (1-9): ")
+        if choice == '9':
             GradeManager.save_grades()
             print("👋 Goodbye!")
             break